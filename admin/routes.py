@@ -8,7 +8,7 @@ What’s included:
 - JSON utilities you already had:
     GET  /_admin/health
     POST /_admin/grant-bonus
-    GET  /_admin/logs/api
+    GET  /_admin/logs/api        (?limit=N&before_id=ID keyset paging)
     GET  /_admin/logs/webhooks
     GET  /_admin/logs/actions
 - NEW hidden HTML admin pages:
@@ -24,6 +24,7 @@ Register in app.py if you haven’t already:
 from __future__ import annotations
 
 from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from flask import (
@@ -37,7 +38,8 @@ from flask import (
     current_app,
 )
 from flask_login import current_user, login_required
-from sqlalchemy import or_
+from sqlalchemy import or_, text
+from sqlalchemy.orm import load_only
 
 from app import db
 from models import User
@@ -48,9 +50,9 @@ from . import bp  # blueprint defined in admin/__init__.py (url_prefix="/_admin"
 # --------------------------------------------------------------------
 
 def _require_admin():
-    if not getattr(current_user, "is_authenticated", False):
+    if not current_user.is_authenticated:
         abort(401)
-    if not bool(getattr(current_user, "is_admin", False)):
+    if not current_user.is_admin:
         abort(403)
     return None
 
@@ -88,11 +90,11 @@ def grant_bonus():
 
     try:
         db.session.execute(
-            """
+            text("""
             UPDATE users
                SET bonus_mass_offers = COALESCE(bonus_mass_offers, 0) + :count
              WHERE id = :user_id
-            """,
+            """),
             {"count": count, "user_id": user_id},
         )
         db.session.commit()
@@ -114,74 +116,83 @@ def _limit_param(default: int = 100, max_cap: int = 500) -> int:
     return min(max(1, n), max_cap)
 
 
-@bp.route("/logs/api", methods=["GET"])
-def logs_api():
-    if (resp := _require_admin()) is not None:
-        return resp
+def _before_id_param() -> Optional[int]:
+    """Keyset cursor: only return rows with id < before_id (None = first page)."""
+    before_id = request.args.get("before_id", type=int)
+    return before_id if before_id and before_id > 0 else None
+
+
+_API_LOG_COLS = (
+    "id, created_at, user_id, league_id, host, method, endpoint, "
+    "status_code, response_ms, ok, throttled, message"
+)
+_WEBHOOK_LOG_COLS = "id, event_id, event_type, received_at, processed_at, success, error"
+_ACTION_LOG_COLS = "id, created_at, user_id, league_id, action_type, target_week, result_ok, message"
+
+
+@lru_cache(maxsize=8)
+def _log_stmt(table: str, cols: str, keyset: bool):
+    """Build (once) the newest-first SELECT for a log table; only binds vary per request."""
+    where = "WHERE id < :before_id" if keyset else ""
+    return text(f"SELECT {cols} FROM {table} {where} ORDER BY id DESC LIMIT :limit")
 
+
+def _log_page(table: str, cols: str):
     limit = _limit_param()
+    before_id = _before_id_param()
     try:
         rows = db.session.execute(
-            f"""
-            SELECT id, created_at, user_id, league_id, host, method, endpoint,
-                   status_code, response_ms, ok, throttled, message
-              FROM api_call_logs
-          ORDER BY id DESC
-             LIMIT {limit}
-        """
+            _log_stmt(table, cols, before_id is not None),
+            {"limit": limit, "before_id": before_id},
         ).mappings().all()
-        return jsonify({"items": [dict(r) for r in rows], "limit": limit})
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+    items = [dict(r) for r in rows]
+    # A full page means there may be more; hand back the cursor for the next one
+    next_before_id = items[-1]["id"] if len(items) == limit else None
+    return jsonify({
+        "items": items,
+        "limit": limit,
+        "before_id": before_id,
+        "next_before_id": next_before_id,
+    })
+
+
+@bp.route("/logs/api", methods=["GET"])
+def logs_api():
+    if (resp := _require_admin()) is not None:
+        return resp
+    return _log_page("api_call_logs", _API_LOG_COLS)
+
 
 @bp.route("/logs/webhooks", methods=["GET"])
 def logs_webhooks():
     if (resp := _require_admin()) is not None:
         return resp
-
-    limit = _limit_param()
-    try:
-        rows = db.session.execute(
-            f"""
-            SELECT id, event_id, event_type, received_at, processed_at, success, error
-              FROM stripe_webhook_logs
-          ORDER BY id DESC
-             LIMIT {limit}
-        """
-        ).mappings().all()
-        return jsonify({"items": [dict(r) for r in rows], "limit": limit})
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    return _log_page("stripe_webhook_logs", _WEBHOOK_LOG_COLS)
 
 
 @bp.route("/logs/actions", methods=["GET"])
 def logs_actions():
     if (resp := _require_admin()) is not None:
         return resp
-
-    limit = _limit_param()
-    try:
-        rows = db.session.execute(
-            f"""
-            SELECT id, created_at, user_id, league_id, action_type, target_week, result_ok, message
-              FROM action_logs
-          ORDER BY id DESC
-             LIMIT {limit}
-        """
-        ).mappings().all()
-        return jsonify({"items": [dict(r) for r in rows], "limit": limit})
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    return _log_page("action_logs", _ACTION_LOG_COLS)
 
 
 # --------------------------------------------------------------------
 # NEW: HTML Admin UI — list/search users
-#  GET /_admin/users?q=...
+#  GET /_admin/users?q=...[&contains=1]
 # --------------------------------------------------------------------
 
 ALLOWED_PLANS = ["free", "mgr5", "mgr12", "unlimited", "founder"]
 
+
+def _like_escape(s: str) -> str:
+    """Escape LIKE wildcards so typed '%'/'_' can't turn a prefix search into a scan."""
+    return s.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
 @bp.route("/users", methods=["GET"])
 @login_required
 def users_list():
@@ -189,10 +200,21 @@ def users_list():
         return resp
 
     q = (request.args.get("q") or "").strip()
-    qry = User.query
+    contains = request.args.get("contains") == "1"
+    # Only the columns the list template shows (skips cookie/session TEXT columns)
+    qry = User.query.options(load_only(
+        User.id, User.email, User.username, User.plan, User.is_admin, User.bonus_mass_offers,
+    ))
     if q:
-        like = f"%{q}%"
-        qry = qry.filter(or_(User.email.ilike(like), User.username.ilike(like)))
+        # Plain col LIKE: MySQL's case-insensitive collation already makes the
+        # match case-insensitive, and the default prefix form ('q%') can range-scan
+        # the existing email/username indexes. "contains" ('%q%') is a scan.
+        term = _like_escape(q)
+        like = f"%{term}%" if contains else f"{term}%"
+        qry = qry.filter(or_(
+            User.email.like(like, escape="\\"),
+            User.username.like(like, escape="\\"),
+        ))
     page = 1
     try:
         page = max(int(request.args.get("page", "1")), 1)
@@ -219,6 +241,7 @@ def users_list():
         "admin/users.html",
         view="list",
         q=q,
+        contains=contains,
         users=results,
         plans=ALLOWED_PLANS,
         page=page,
@@ -239,7 +262,7 @@ def users_edit(user_id: int):
     if (resp := _require_admin()) is not None:
         return resp
 
-    user: Optional[User] = User.query.get(user_id)
+    user: Optional[User] = db.session.get(User, user_id)
     if not user:
         flash("User not found.", "warning")
         return redirect(url_for("admin.users_list"))
@@ -1,10 +1,13 @@
 # app.py
 import os
+import atexit
+import queue
 import logging
-from logging.handlers import RotatingFileHandler
-from datetime import datetime, date
+from functools import wraps
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from datetime import datetime, timezone
 
-from flask import Flask, render_template, redirect, url_for, request, flash
+from flask import Flask, g, render_template, redirect, url_for, request, flash, make_response, session
 from flask_sqlalchemy import SQLAlchemy
 from flask_bcrypt import Bcrypt
 from flask_login import LoginManager, current_user, login_required
@@ -17,12 +20,33 @@ db = SQLAlchemy()
 bcrypt = Bcrypt()
 login_manager = LoginManager()
 
+# File logging runs on a background listener thread; request threads only enqueue
+_LOG_QUEUE: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+_LOG_QUEUE_HANDLER = QueueHandler(_LOG_QUEUE)
+_LOG_LISTENER: QueueListener | None = None
+
+# Endpoints that must remain accessible while the legal gate is enforced
+_LEGAL_ALLOWED = frozenset({
+    "legal_terms", "legal_privacy", "legal_aup",
+    "legal_review", "legal_accept",
+    "static", "auth.logout", "auth.login", "auth.register",
+})
+
 
 def _configure_logging(app: Flask) -> None:
     """
     Make INFO logs visible and also write to logs/fantasyhub.log with rotation.
     PythonAnywhere will also capture these in the Error log.
+
+    The RotatingFileHandler is owned by a QueueListener thread so disk writes
+    and rotation never block the request that logged.
     """
+    global _LOG_LISTENER
+
+    # Idempotent per app: skip if this app's logger is already wired up
+    if app.extensions.get("fh_log_configured"):
+        return
+
     # Raise app logger to INFO
     app.logger.setLevel(logging.INFO)
     for h in app.logger.handlers:
@@ -33,23 +57,50 @@ def _configure_logging(app: Flask) -> None:
     os.makedirs(log_dir, exist_ok=True)
     file_path = os.path.join(log_dir, "fantasyhub.log")
 
-    file_handler = RotatingFileHandler(file_path, maxBytes=1_000_000, backupCount=3)
-    file_handler.setLevel(logging.INFO)
-    file_handler.setFormatter(logging.Formatter(
-        "%(asctime)s %(levelname)s %(name)s: %(message)s"
-    ))
-
-    # Avoid adding duplicate handlers if app reloads
-    already_added = any(
-        isinstance(h, RotatingFileHandler) and getattr(h, 'baseFilename', '') == file_path
-        for h in app.logger.handlers
-    )
-    if not already_added:
-        app.logger.addHandler(file_handler)
+    if _LOG_LISTENER is None:
+        file_handler = RotatingFileHandler(file_path, maxBytes=1_000_000, backupCount=3)
+        file_handler.setLevel(logging.INFO)
+        file_handler.setFormatter(logging.Formatter(
+            "%(asctime)s %(levelname)s %(name)s: %(message)s"
+        ))
+        _LOG_LISTENER = QueueListener(_LOG_QUEUE, file_handler, respect_handler_level=True)
+        _LOG_LISTENER.start()
+        atexit.register(_LOG_LISTENER.stop)  # flush queued records on shutdown
+
+    # One shared handler instance: addHandler() ignores it if the logger already has it
+    _LOG_QUEUE_HANDLER.setLevel(logging.INFO)
+    app.logger.addHandler(_LOG_QUEUE_HANDLER)
+    app.extensions["fh_log_configured"] = True
 
     app.logger.info("Logging configured. Writing to %s", file_path)
 
 
+def cacheable(seconds: int = 3600):
+    """
+    Cache headers for mostly-static pages (landing, legal, pricing).
+
+    Every response gets an ETag and honors If-None-Match. A shared max-age is
+    only set for anonymous visitors with no session changes (e.g. no flashes
+    consumed), because base.html renders the signed-in nav and flash messages.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapped(*args, **kwargs):
+            resp = make_response(view(*args, **kwargs))
+            if resp.status_code != 200:
+                return resp
+            if not current_user.is_authenticated and not session.modified:
+                resp.cache_control.public = True
+                resp.cache_control.max_age = seconds
+                resp.vary.add("Cookie")
+            else:
+                resp.cache_control.no_cache = True  # revalidate via ETag
+            resp.add_etag()
+            return resp.make_conditional(request)
+        return wrapped
+    return decorator
+
+
 def create_app():
     app = Flask(
         __name__,
@@ -68,6 +119,34 @@ def create_app():
     # Optional: cap MFL response body logging length (used by mfl_client)
     app.config.setdefault("MFL_LOG_BODY_CHARS", 5000)
 
+    # bcrypt work factor; hashes at a different cost are upgraded on next login
+    app.config.setdefault("BCRYPT_LOG_ROUNDS", int(os.getenv("BCRYPT_ROUNDS", "12")))
+
+    # Ping pooled connections on checkout and retire them before MySQL's idle
+    # timeout (PythonAnywhere drops them after ~300s), so a request never
+    # stalls on a dead socket. Override in config.py if needed.
+    app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", {
+        "pool_pre_ping": True,
+        "pool_recycle": 280,
+    })
+
+    # Optional: run db.create_all() at startup (dev/test only)
+    app.config.setdefault("AUTO_CREATE_ALL", False)
+
+    # Legal versions are constants for the process lifetime; resolve once
+    app.config["LEGAL_VERSIONS"] = current_versions()
+
+    # Stripe price ids shown on /pricing (env is fixed for the process lifetime)
+    app.config["PRICING_IDS"] = {
+        "MGR5_WEEKLY": os.getenv("PRICE_MGR5_WEEKLY", ""),
+        "MGR5_SEASON": os.getenv("PRICE_MGR5_SEASON", ""),
+        "MGR12_WEEKLY": os.getenv("PRICE_MGR12_WEEKLY", ""),
+        "MGR12_SEASON": os.getenv("PRICE_MGR12_SEASON", ""),
+        "UNLIMITED_WEEKLY": os.getenv("PRICE_UNLIMITED_WEEKLY", ""),
+        "UNLIMITED_SEASON": os.getenv("PRICE_UNLIMITED_SEASON", ""),
+        "FOUNDER_ONETIME": os.getenv("PRICE_FOUNDER_ONETIME", ""),
+    }
+
     # Initialize extensions
     db.init_app(app)
     bcrypt.init_app(app)
@@ -78,13 +157,17 @@ def create_app():
     # Enable INFO logging & file logs
     _configure_logging(app)
 
-    # Import models after db is ready to avoid circulars
-    from models import User, League  # noqa: F401
+    # Import models/services after db is ready to avoid circulars; the view
+    # closures below reuse these bindings instead of importing per request
+    from models import User, League
+    from services.entitlements import get_entitlements, describe_plan
+    from services.store import get_account_bundle
+    from services.guards import week_monday_key
 
     @login_manager.user_loader
     def load_user(user_id: str):
         try:
-            return User.query.get(int(user_id))
+            return db.session.get(User, int(user_id))
         except Exception:
             return None
 
@@ -111,6 +194,7 @@ def create_app():
 
     # ----- Routes -----
     @app.route("/")
+    @cacheable(seconds=3600)
     def index():
         return render_template("index.html")
 
@@ -125,48 +209,37 @@ def create_app():
         if not current_user.is_authenticated:
             return redirect(url_for("auth.login"))
 
-        # local import to avoid early import cycles
-        from models import League as _League
-        has_leagues = _League.query.filter_by(user_id=current_user.id).count() > 0
+        # existence probe on the user_id index instead of a COUNT aggregate
+        has_leagues = (
+            db.session.query(League.id).filter_by(user_id=current_user.id).first()
+            is not None
+        )
         if has_leagues:
             return redirect(url_for("leagues.my_leagues"))
         return redirect(url_for("mfl.mfl_login"))
 
-    # Dev convenience: create tables if they don't exist
-    with app.app_context():
-        db.create_all()
-        app.logger.info("Database tables ensured (create_all).")
+    # Dev convenience: create tables if they don't exist (off by default so worker
+    # boots don't pay for schema reflection; production uses create_tables.py)
+    if app.config.get("AUTO_CREATE_ALL"):
+        with app.app_context():
+            db.create_all()
+            app.logger.info("Database tables ensured (create_all).")
 
     @app.route("/pricing")
+    @cacheable(seconds=3600)
     def pricing():
-        prices = {
-            "MGR5_WEEKLY": os.getenv("PRICE_MGR5_WEEKLY", ""),
-            "MGR5_SEASON": os.getenv("PRICE_MGR5_SEASON", ""),
-            "MGR12_WEEKLY": os.getenv("PRICE_MGR12_WEEKLY", ""),
-            "MGR12_SEASON": os.getenv("PRICE_MGR12_SEASON", ""),
-            "UNLIMITED_WEEKLY": os.getenv("PRICE_UNLIMITED_WEEKLY", ""),
-            "UNLIMITED_SEASON": os.getenv("PRICE_UNLIMITED_SEASON", ""),
-            "FOUNDER_ONETIME": os.getenv("PRICE_FOUNDER_ONETIME", ""),
-        }
-        return render_template("pricing.html", prices=prices)
+        return render_template("pricing.html", prices=app.config["PRICING_IDS"])
 
     @app.route("/account")
     @login_required
     def account():
-        from models import League as _League
-        from services.entitlements import get_entitlements, describe_plan
-        from services.store import (
-            get_today_count,
-            get_bonus_balance,
-            get_weekly_free_used,
-        )
-        from services.guards import week_monday_key
-        from datetime import date
-
         u = current_user
 
+        # All per-user counters in one round-trip (league count, daily/weekly usage, bonus)
+        bundle = get_account_bundle(u.id, g.today, week_monday_key(g.today))
+
         # Counts + plan
-        leagues_count = _League.query.filter_by(user_id=u.id).count()
+        leagues_count = bundle["leagues_count"]
         ent = get_entitlements(u)
         plan_label = describe_plan(u)
         plan_key = ent.get("plan_key", "free")
@@ -177,17 +250,17 @@ def create_app():
 
         # Paid daily caps (shown for paid plans)
         mass_offer_daily_cap = int(ent.get("mass_offer_daily_cap", 0) or 0)
-        mass_offers_today = int(get_today_count(u.id, date.today()) or 0)
+        mass_offers_today = bundle["today_count"]
 
         # Free weekly allowance
         weekly_free_quota = int(ent.get("free_mass_offer_weekly", 0) or 0)  # usually 1 on free, 0 on paid
-        weekly_free_used = bool(get_weekly_free_used(u.id, week_monday_key())) if weekly_free_quota > 0 else False
+        weekly_free_used = bundle["weekly_free_used"] if weekly_free_quota > 0 else False
 
         # Bonus balance (applies to all plans)
-        bonus_mass_offers = int(get_bonus_balance(u.id) or 0)
+        bonus_mass_offers = bundle["bonus_balance"]
 
         # Legal status
-        v = current_versions()
+        v = app.config["LEGAL_VERSIONS"]
         legal_ok = (
             getattr(u, "tos_version", None) == v["tos"]
             and getattr(u, "privacy_version", None) == v["privacy"]
@@ -216,35 +289,40 @@ def create_app():
             legal_ok=legal_ok,
         )
     @app.route("/legal/terms")
+    @cacheable(seconds=3600)
     def legal_terms():
         return render_template("legal/terms.html")
 
     @app.route("/legal/privacy")
+    @cacheable(seconds=3600)
     def legal_privacy():
         return render_template("legal/privacy.html")
 
     @app.route("/legal/aup")
+    @cacheable(seconds=3600)
     def legal_aup():
         return render_template("legal/aup.html")
 
+    # ---------- Per-request clock: one read shared by every view/hook ----------
+    @app.before_request
+    def _stamp_request_clock():
+        g.now = datetime.now(timezone.utc)
+        g.today = g.now.astimezone().date()  # local date, same as date.today() used by the counters
+
     # ---------- Legal gate: require acceptance of current versions (flagged) ----------
     @app.before_request
     def _require_legal_acceptance():
         try:
+            if request.endpoint == "static":
+                return  # cheapest check first: assets never need the gate
             if not app.config.get("LEGAL_GATE_ENABLED", False):
                 return  # gate disabled by default until template is added
             if not current_user.is_authenticated:
                 return
-            # endpoints that must remain accessible
-            allowed = {
-                "legal_terms", "legal_privacy", "legal_aup",
-                "legal_review", "legal_accept",
-                "static", "auth.logout", "auth.login", "auth.register"
-            }
-            if request.endpoint in allowed:
+            if request.endpoint in _LEGAL_ALLOWED:
                 return
 
-            v = current_versions()
+            v = app.config["LEGAL_VERSIONS"]
             ok = (
                 getattr(current_user, "tos_version", None) == v["tos"]
                 and getattr(current_user, "privacy_version", None) == v["privacy"]
@@ -261,7 +339,7 @@ def create_app():
     def legal_review():
         nxt = request.args.get("next") or url_for("index")
         return render_template("legal/review.html",
-                               versions=current_versions(),
+                               versions=app.config["LEGAL_VERSIONS"],
                                next_url=nxt)
 
     @app.route("/legal/accept", methods=["POST"])
@@ -269,7 +347,7 @@ def create_app():
         if not current_user.is_authenticated:
             return redirect(url_for("auth.login"))
 
-        v = current_versions()
+        v = app.config["LEGAL_VERSIONS"]
         # best-effort IP behind proxies
         ip = request.headers.get("X-Forwarded-For", request.remote_addr) or ""
         ip = ip.split(",")[0].strip() if ip else None
@@ -278,7 +356,7 @@ def create_app():
             current_user.tos_version = v["tos"]
             current_user.privacy_version = v["privacy"]
             current_user.aup_version = v["aup"]
-            current_user.terms_accepted_at = datetime.utcnow()
+            current_user.terms_accepted_at = g.now.replace(tzinfo=None)  # naive UTC column
             current_user.terms_accepted_ip = ip
             db.session.commit()
             flash("Thanks! Your acceptance has been recorded.", "success")
@@ -1,8 +1,8 @@
 # auth/routes.py
-from flask import Blueprint, render_template, request, redirect, url_for, flash
+from flask import Blueprint, render_template, request, redirect, url_for, flash, g
 from flask_login import login_user, logout_user, current_user, login_required
 from urllib.parse import urlparse, urljoin
-from sqlalchemy import or_
+from sqlalchemy import insert, or_
 from sqlalchemy.exc import IntegrityError
 
 from app import db, bcrypt
@@ -10,11 +10,37 @@ from models import User, League, Team
 
 auth_bp = Blueprint("auth", __name__, url_prefix="/auth")
 
-
 def is_safe_url(target: str) -> bool:
-    ref_url = urlparse(request.host_url)
+    if not target:
+        return False
+    # Browsers treat "/\\host" like "//host", but urljoin keeps it as a path
+    if target.startswith("/\\"):
+        return False
+    # Plain same-host paths ("/leagues?x=1") need no parsing
+    if target.startswith("/") and not target.startswith("//"):
+        return True
     test_url = urlparse(urljoin(request.host_url, target))
-    return test_url.scheme in ("http", "https") and ref_url.netloc == test_url.netloc
+    # request.host is host_url's netloc (host[:port]) without re-parsing it
+    return test_url.scheme in ("http", "https") and test_url.netloc == request.host
+
+
+def _duplicate_field(exc: IntegrityError) -> str | None:
+    """
+    Which users column a unique violation hit: "username", "email" or None.
+    MySQL: "Duplicate entry '...' for key 'users.ix_users_email'"
+    SQLite: "UNIQUE constraint failed: users.email"
+    """
+    msg = str(getattr(exc, "orig", exc)).lower()
+    # Only look at the key/column part so the duplicated value can't confuse us
+    if "for key" in msg:
+        msg = msg.rsplit("for key", 1)[1]
+    elif "constraint failed:" in msg:
+        msg = msg.rsplit("constraint failed:", 1)[1]
+    if "username" in msg:
+        return "username"
+    if "email" in msg:
+        return "email"
+    return None
 
 
 @auth_bp.route("/login", methods=["GET", "POST"])
@@ -23,17 +49,35 @@ def login():
         return redirect(url_for("start"))
 
     if request.method == "POST":
-        username_or_email = request.form.get("username_or_email", "").strip()
-        password = request.form.get("password", "")
-
-        user = (
-            User.query.filter_by(username=username_or_email).first()
-            or User.query.filter_by(email=username_or_email.lower()).first()
+        form = request.form
+        username_or_email = form.get("username_or_email", "").strip()
+        password = form.get("password", "")
+
+        # One round-trip over both unique indexes; a username match still wins
+        # over an email match, as with the old two-query lookup.
+        candidates = (
+            User.query.filter(or_(
+                User.username == username_or_email,
+                User.email == username_or_email.lower(),
+            ))
+            .limit(2)
+            .all()
+        )
+        user = next(
+            (u for u in candidates if u.username == username_or_email),
+            candidates[0] if candidates else None,
         )
 
         if user and user.check_password(password):
+            # Re-hash at the current work factor while we have the plaintext
+            if user.password_needs_rehash():
+                try:
+                    user.set_password(password)
+                    db.session.commit()
+                except Exception:
+                    db.session.rollback()
             login_user(user, remember=True)
-            next_url = request.args.get("next") or request.form.get("next")
+            next_url = request.args.get("next") or form.get("next")
             if next_url and is_safe_url(next_url):
                 return redirect(next_url)
             return redirect(url_for("start"))
@@ -49,9 +93,10 @@ def register():
         return redirect(url_for("start"))
 
     if request.method == "POST":
-        username = request.form.get("username", "").strip()
-        email = (request.form.get("email", "") or "").strip().lower()
-        password = request.form.get("password", "") or ""
+        form = request.form
+        username = form.get("username", "").strip()
+        email = (form.get("email", "") or "").strip().lower()
+        password = form.get("password", "") or ""
 
         errors = []
         if len(username) < 3:
@@ -61,25 +106,26 @@ def register():
         if len(password) < 8:
             errors.append("Password must be at least 8 characters.")
 
-        # Check if taken
-        existing = User.query.filter(or_(User.username == username, User.email == email)).first()
-        if existing:
-            errors.append("Username or email is already in use.")
-
         if errors:
             for e in errors:
                 flash(e, "danger")
             return render_template("register.html")
 
-        # Create user
+        # Create user; the unique indexes on username/email are the duplicate check
         user = User(username=username, email=email)
         user.set_password(password)
         db.session.add(user)
         try:
             db.session.commit()
-        except IntegrityError:
+        except IntegrityError as e:
             db.session.rollback()
-            flash("Username or email already exists.", "danger")
+            field = _duplicate_field(e)
+            if field == "username":
+                flash("That username is already in use.", "danger")
+            elif field == "email":
+                flash("That email is already in use.", "danger")
+            else:
+                flash("Username or email already exists.", "danger")
             return render_template("register.html")
 
         # Auto-login then run start logic
@@ -109,39 +155,40 @@ def mfl_link():
 @auth_bp.route("/mfl/mock_sync", methods=["POST"])
 @login_required
 def mfl_mock_sync():
-    # Seed only if user has no leagues yet
-    existing = League.query.filter_by(user_id=current_user.id).count()
-    if existing == 0:
-        from datetime import datetime
-
-        l1 = League(
+    # Seed only if user has no leagues yet (EXISTS probe, not a COUNT)
+    has_any = db.session.query(
+        db.session.query(League.id).filter_by(user_id=current_user.id).exists()
+    ).scalar()
+    if not has_any:
+        # Core inserts: the route never reads these rows back, so skip the ORM
+        # unit of work. MySQL has no INSERT ... RETURNING, so league ids come
+        # from each statement's lastrowid; teams go out as one executemany.
+        now = g.now.replace(tzinfo=None)  # naive UTC column
+        l1_id = db.session.execute(insert(League).values(
             user_id=current_user.id,
             mfl_id="11376",
             name="#SFB15 - Springfield Isotopes",
             year=2025,
-            synced_at=datetime.utcnow(),
+            synced_at=now,
             roster_slots=None,
             franchise_id=None,
-        )
-        l2 = League(
+        )).inserted_primary_key[0]
+        l2_id = db.session.execute(insert(League).values(
             user_id=current_user.id,
             mfl_id="61860",
             name="All Play League",
             year=2025,
-            synced_at=datetime.utcnow(),
+            synced_at=now,
             roster_slots="QB:1,RB:2-4,WR:3-5,TE:1-3",
             franchise_id="0006",
-        )
-        db.session.add_all([l1, l2])
-        db.session.flush()
-
-        teams = [
-            Team(league_id=l1.id, mfl_id="0001", name="Sharks", owner_name=current_user.username),
-            Team(league_id=l1.id, mfl_id="0002", name="Wolves", owner_name="Rival GM"),
-            Team(league_id=l2.id, mfl_id="0006", name="My Team", owner_name=current_user.username),
-            Team(league_id=l2.id, mfl_id="0002", name="Hawks", owner_name="Rival GM"),
-        ]
-        db.session.add_all(teams)
+        )).inserted_primary_key[0]
+
+        db.session.execute(insert(Team), [
+            dict(league_id=l1_id, mfl_id="0001", name="Sharks", owner_name=current_user.username),
+            dict(league_id=l1_id, mfl_id="0002", name="Wolves", owner_name="Rival GM"),
+            dict(league_id=l2_id, mfl_id="0006", name="My Team", owner_name=current_user.username),
+            dict(league_id=l2_id, mfl_id="0002", name="Hawks", owner_name="Rival GM"),
+        ])
         db.session.commit()
         flash("Mock MFL sync complete. Leagues added.", "success")
     else:
@@ -3,8 +3,10 @@ from __future__ import annotations
 
 import os
 import datetime as _dt
+from functools import lru_cache
 from urllib.parse import urljoin
-from typing import Any, Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
 
 import stripe
 from flask import (
@@ -18,9 +20,12 @@ from flask import (
 )
 from flask_login import login_required, current_user
 from flask import has_app_context
+from sqlalchemy import insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import raiseload
 
 from app import db
-from models import User
+from models import StripeEvent, User
 
 billing_bp = Blueprint("billing", __name__, url_prefix="/billing")
 
@@ -47,7 +52,9 @@ def _stripe_key() -> str:
     return _require("STRIPE_SECRET_KEY")
 
 def _ensure_stripe() -> None:
-    stripe.api_key = _stripe_key()
+    # The key is fixed for the process lifetime; resolve it on first use only
+    if not stripe.api_key:
+        stripe.api_key = _stripe_key()
 
 def _base_url() -> str:
     """Absolute site base, e.g. https://www.rosterdash.com/ (trailing slash)."""
@@ -59,8 +66,13 @@ def _base_url() -> str:
 
 # ───────────────────────────── price ids & mapping ─────────────────────────────
 
+@lru_cache(maxsize=1)
 def _price_ids() -> Dict[str, str]:
-    """Resolve your price IDs lazily (works inside/outside app ctx)."""
+    """
+    Resolve your price IDs lazily (works inside/outside app ctx).
+    Memoized: env/config don't change mid-process. Snapshotted into _PRICE_IDS
+    when the blueprint is registered.
+    """
     return {
         "FOUNDER_ONETIME": _get_cfg("PRICE_FOUNDER_ONETIME") or "price_1S6XEJ3UIVtwjIKCMD3gBcff",
 
@@ -74,10 +86,12 @@ def _price_ids() -> Dict[str, str]:
         "PWR50_WEEKLY":    _get_cfg("PRICE_UNLIMITED_WEEKLY") or "price_1S6XBH3UIVtwjIKCmfk3PJhA",
     }
 
+@lru_cache(maxsize=1)
 def _plan_by_price() -> Dict[str, Dict[str, Any]]:
     """
     Map Stripe price_id -> normalized tier (what templates expect) + cadence + caps.
     We always store user.plan as the TIER ONLY, not including cadence.
+    Memoized alongside _price_ids; snapshotted into _PLAN_BY_PRICE.
     """
     P = _price_ids()
     return {
@@ -92,6 +106,22 @@ def _plan_by_price() -> Dict[str, Dict[str, Any]]:
         P["PWR50_WEEKLY"]: {"tier": "UNLIMITED", "cadence": "weekly", "league_cap": 50, "mass_offer_daily_cap": 99999},
     }
 
+# Frozen at blueprint registration (inside the app context, so config-only
+# price ids are seen too); request/webhook code reads these, not the builders.
+_PRICE_IDS: Mapping[str, str] = MappingProxyType({})
+_PLAN_BY_PRICE: Mapping[str, Dict[str, Any]] = MappingProxyType({})
+
+@billing_bp.record_once
+def _init_price_tables(state) -> None:
+    global _PRICE_IDS, _PLAN_BY_PRICE
+    with state.app.app_context():
+        _price_ids.cache_clear()
+        _plan_by_price.cache_clear()
+        _PRICE_IDS = MappingProxyType(_price_ids())
+        _PLAN_BY_PRICE = MappingProxyType(_plan_by_price())
+
+_CHECKOUT_MODES = frozenset({"subscription", "payment"})
+
 # free/founder constants
 FREE_LEAGUE_CAP = 3
 FOUNDER_TERM_DAYS = 730
@@ -100,11 +130,38 @@ FOUNDER_MASS_OFFERS = 99999
 
 # ───────────────────────────── URL helpers ─────────────────────────────
 
+_BILLING_PATHS = {
+    "success": "account?checkout=success",
+    "cancel": "pricing",
+    "account": "account",
+}
+
+@billing_bp.record_once
+def _init_billing_urls(state) -> None:
+    """With APP_BASE_URL configured the redirect targets are fixed; join them once."""
+    with state.app.app_context():
+        explicit = _get_cfg("APP_BASE_URL")
+    if explicit:
+        base = explicit if explicit.endswith("/") else explicit + "/"
+        state.app.extensions["billing_urls"] = {
+            name: urljoin(base, path) for name, path in _BILLING_PATHS.items()
+        }
+
+def _billing_url(name: str) -> str:
+    urls = current_app.extensions.get("billing_urls")
+    if urls:
+        return urls[name]
+    # No APP_BASE_URL: depends on the request host, so build it per request
+    return urljoin(_base_url(), _BILLING_PATHS[name])
+
 def _success_url() -> str:
-    return urljoin(_base_url(), "account?checkout=success")
+    return _billing_url("success")
 
 def _cancel_url() -> str:
-    return urljoin(_base_url(), "pricing")
+    return _billing_url("cancel")
+
+def _account_url() -> str:
+    return _billing_url("account")
 
 # ───────────────────────────── Checkout ─────────────────────────────
 
@@ -120,7 +177,7 @@ def start_checkout(price_id: str):
     _ensure_stripe()
 
     mode = (request.args.get("mode") or "subscription").strip().lower()
-    if mode not in {"subscription", "payment"}:
+    if mode not in _CHECKOUT_MODES:
         return jsonify({"error": "Invalid mode. Use 'subscription' or 'payment'."}), 400
 
     existing_customer = getattr(current_user, "stripe_customer_id", None)
@@ -181,7 +238,7 @@ def billing_portal():
     try:
         session = stripe.billing_portal.Session.create(
             customer=customer_id,
-            return_url=urljoin(_base_url(), "account"),
+            return_url=_account_url(),
         )
         return redirect(session.url)
     except stripe.error.StripeError as e:
@@ -197,8 +254,12 @@ def _webhook_secret() -> str:
         raise RuntimeError("STRIPE_WEBHOOK_SECRET not set")
     return sec
 
+# Mapped users columns, resolved once; schema is hand-managed, so some
+# optional billing columns (e.g. stripe_status) may not exist yet
+_USER_COLS = frozenset(c.key for c in User.__table__.columns)
+
 def _set_if_has(user: User, field: str, value: Any) -> None:
-    if hasattr(user, field):
+    if field in _USER_COLS:
         setattr(user, field, value)
 
 def _apply_founder(user: User, now_utc: Optional[_dt.datetime] = None) -> None:
@@ -209,7 +270,7 @@ def _apply_founder(user: User, now_utc: Optional[_dt.datetime] = None) -> None:
     _set_if_has(user, "mass_offer_daily_cap", FOUNDER_MASS_OFFERS)
 
 def _apply_subscription_plan(user: User, price_id: str) -> None:
-    plan = _plan_by_price().get(price_id)
+    plan = _PLAN_BY_PRICE.get(price_id)
     if not plan:
         current_app.logger.info("[Stripe] Unknown price_id=%s; skipping plan update", price_id)
         return
@@ -222,7 +283,7 @@ def _apply_subscription_plan(user: User, price_id: str) -> None:
 def _downgrade_to_free_or_founder(user: User) -> None:
     now = _dt.datetime.now(_dt.timezone.utc)
     founder_ok = False
-    if hasattr(user, "founder_expires_at") and user.founder_expires_at:
+    if "founder_expires_at" in _USER_COLS and user.founder_expires_at:
         try:
             founder_ok = user.founder_expires_at > now
         except Exception:
@@ -235,17 +296,59 @@ def _downgrade_to_free_or_founder(user: User) -> None:
         _set_if_has(user, "mass_offer_daily_cap", 0)
         _set_if_has(user, "stripe_price_id", None)
 
+# Stripe event payloads are a few KB; anything far larger isn't from Stripe
+_WEBHOOK_MAX_BYTES = 65536
+# "t=<ts>,v1=<hex64>[,v1=...][,v0=...]" -- room for a few rotated secrets
+_WEBHOOK_SIG_MAX_LEN = 1024
+
+def _read_capped(stream, limit: int) -> bytes:
+    """Read until EOF or `limit` bytes, whichever comes first (short reads are retried)."""
+    buf = bytearray()
+    while len(buf) < limit:
+        chunk = stream.read(limit - len(buf))
+        if not chunk:
+            break
+        buf += chunk
+    return bytes(buf)
+
+def _plausible_signature(sig: str) -> bool:
+    """Cheap shape check so junk requests skip the body read and HMAC."""
+    return 0 < len(sig) <= _WEBHOOK_SIG_MAX_LEN and "t=" in sig and "v1=" in sig
+
+# Webhook handlers only touch scalar columns on User; raiseload("*") makes any
+# accidental relationship access fail loudly instead of lazy-loading (N+1).
+_WEBHOOK_USER_OPTS = (raiseload("*"),)
+
+def _user_by_customer(customer_id: Optional[str]) -> Optional[User]:
+    if not customer_id:
+        return None
+    # ix_users_stripe_customer_id is unique on fresh databases, but create_all
+    # never adds it to an existing users table; until it exists there, tolerate
+    # duplicates (first user wins) rather than raising and dropping the event.
+    stmt = (
+        select(User)
+        .options(*_WEBHOOK_USER_OPTS)
+        .where(User.stripe_customer_id == customer_id)
+        .order_by(User.id)
+        .limit(2)
+    )
+    users = db.session.execute(stmt).scalars().all()
+    if len(users) > 1:
+        current_app.logger.warning(
+            "Duplicate stripe_customer_id %s on users %s and %s; using the first",
+            customer_id, users[0].id, users[1].id,
+        )
+    return users[0] if users else None
+
 def _find_user(client_reference_id: Optional[str], customer_id: Optional[str]) -> Optional[User]:
     if client_reference_id:
         try:
-            u = db.session.get(User, int(client_reference_id))
+            u = db.session.get(User, int(client_reference_id), options=_WEBHOOK_USER_OPTS)
             if u:
                 return u
         except Exception:
             pass
-    if customer_id:
-        return db.session.query(User).filter_by(stripe_customer_id=customer_id).first()
-    return None
+    return _user_by_customer(customer_id)
 
 @billing_bp.route("/webhook", methods=["POST"])
 def stripe_webhook():
@@ -256,8 +359,16 @@ def stripe_webhook():
         current_app.logger.error("[Stripe] webhook misconfigured: %s", e)
         return jsonify({"error": "misconfigured"}), 500
 
-    payload = request.get_data(as_text=True)
     sig = request.headers.get("Stripe-Signature", "")
+    if not _plausible_signature(sig):
+        return abort(400)
+    if request.content_length and request.content_length > _WEBHOOK_MAX_BYTES:
+        return abort(413)
+    # Raw bytes: construct_event verifies them as-is, no text decode up front.
+    # Bounded read so chunked bodies (no Content-Length) are capped too.
+    payload = _read_capped(request.stream, _WEBHOOK_MAX_BYTES + 1)
+    if len(payload) > _WEBHOOK_MAX_BYTES:
+        return abort(413)
 
     try:
         _ensure_stripe()
@@ -271,6 +382,20 @@ def stripe_webhook():
     obj = event.get("data", {}).get("object", {}) or {}
     current_app.logger.info("[Stripe] event=%s id=%s", etype, event.get("id"))
 
+    # Dedupe retried deliveries. The row is only committed with the handler's
+    # own writes, so a failed handler leaves nothing behind and a retry runs
+    # clean.
+    if event.get("id"):
+        try:
+            db.session.execute(insert(StripeEvent).values(id=event["id"]))
+        except IntegrityError:
+            db.session.rollback()
+            return jsonify({"ok": True, "dedup": True}), 200
+        except Exception as e:
+            # e.g. stripe_events not created yet; process without dedupe
+            db.session.rollback()
+            current_app.logger.warning("[Stripe] event dedupe unavailable: %s", e)
+
     try:
         # 1) Checkout completed (one-time Founder OR subscription)
         if etype == "checkout.session.completed":
@@ -290,17 +415,18 @@ def stripe_webhook():
 
             if mode == "payment":
                 # Founder one-time (no subscription object)
-                if meta_price and meta_price == _price_ids()["FOUNDER_ONETIME"]:
+                if meta_price and meta_price == _PRICE_IDS["FOUNDER_ONETIME"]:
                     _apply_founder(user)
                     _set_if_has(user, "stripe_price_id", meta_price)
                 db.session.commit()
                 return jsonify({"ok": True}), 200
 
             if mode == "subscription":
-                # Fetch subscription to read the definitive price id
+                # start_checkout stamps the price into metadata; only sessions
+                # created without it need the extra round-trip to Stripe
                 sub_id = sess.get("subscription")
-                price_id = None
-                if sub_id:
+                price_id = meta_price
+                if not price_id and sub_id:
                     sub = stripe.Subscription.retrieve(sub_id, expand=["items.data.price"])
                     items = list(sub.get("items", {}).get("data", []))
                     price_id = items[0]["price"]["id"] if items else None
@@ -309,16 +435,28 @@ def stripe_webhook():
                 db.session.commit()
                 return jsonify({"ok": True}), 200
 
-        # 2) Subscription created/updated → (re)apply plan from price
+        # 2) Subscription created/updated → (re)apply plan from price.
+        #    Nothing here depends on the current row, so one UPDATE by customer
+        #    id replaces the SELECT + ORM flush.
         if etype in {"customer.subscription.created", "customer.subscription.updated"}:
             sub = obj
             customer_id = sub.get("customer")
-            user = db.session.query(User).filter_by(stripe_customer_id=customer_id).first()
-            if user:
-                items = list(sub.get("items", {}).get("data", []))
-                price_id = items[0]["price"]["id"] if items else None
-                if price_id:
-                    _apply_subscription_plan(user, price_id)
+            items = list(sub.get("items", {}).get("data", []))
+            price_id = items[0]["price"]["id"] if items else None
+            plan = _PLAN_BY_PRICE.get(price_id) if price_id else None
+            if price_id and not plan:
+                current_app.logger.info("[Stripe] Unknown price_id=%s; skipping plan update", price_id)
+            if customer_id and plan:
+                db.session.execute(
+                    update(User)
+                    .where(User.stripe_customer_id == customer_id)
+                    .values(
+                        plan=plan["tier"],
+                        league_cap=int(plan["league_cap"]),
+                        mass_offer_daily_cap=int(plan["mass_offer_daily_cap"]),
+                        stripe_price_id=price_id,
+                    )
+                )
                 db.session.commit()
             return jsonify({"ok": True}), 200
 
@@ -326,7 +464,7 @@ def stripe_webhook():
         if etype == "customer.subscription.deleted":
             sub = obj
             customer_id = sub.get("customer")
-            user = db.session.query(User).filter_by(stripe_customer_id=customer_id).first()
+            user = _user_by_customer(customer_id)
             if user:
                 _downgrade_to_free_or_founder(user)
                 db.session.commit()
@@ -336,9 +474,13 @@ def stripe_webhook():
         if etype == "invoice.payment_failed":
             inv = obj
             customer_id = inv.get("customer")
-            user = db.session.query(User).filter_by(stripe_customer_id=customer_id).first()
-            if user and hasattr(user, "stripe_status"):
-                _set_if_has(user, "stripe_status", "past_due")
+            # No SELECT needed; skipped entirely while users has no stripe_status
+            if customer_id and "stripe_status" in _USER_COLS:
+                db.session.execute(
+                    update(User)
+                    .where(User.stripe_customer_id == customer_id)
+                    .values(stripe_status="past_due")
+                )
                 db.session.commit()
             return jsonify({"ok": True}), 200
 
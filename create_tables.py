@@ -1,16 +1,51 @@
-from app import create_app, db
-
-# Import your models here
-from models import User, League, Team, Player, Roster, DraftPick  # exact names from your models.py
-
-from sqlalchemy import inspect
-
-app = create_app()
-with app.app_context():
-    # Ensure tables are created
-    db.create_all()
-
-    # Inspect tables
-    inspector = inspect(db.engine)
-    tables = inspector.get_table_names()
-    print("Tables in DB:", tables)
+import os
+
+from sqlalchemy import func, inspect, select, update
+
+from app import create_app, db
+
+# Import your models here
+from models import User, League, Team, Player, Roster, DraftPick  # exact names from your models.py
+
+app = create_app()
+with app.app_context():
+    # Ensure tables are created
+    db.create_all()
+
+    # One-off: create_all() only adds indexes for tables it creates, so an
+    # existing users table needs ix_users_stripe_customer_id added by hand.
+    # The index is unique; duplicate customer ids are reported, and with
+    # FIX_DUPLICATE_STRIPE_CUSTOMERS=1 cleared on every row but the lowest id
+    # (the one the Stripe webhook already resolves to).
+    index_name = "ix_users_stripe_customer_id"
+    existing = {ix["name"] for ix in inspect(db.engine).get_indexes(User.__tablename__)}
+    if index_name not in existing:
+        dupes = db.session.execute(
+            select(User.stripe_customer_id, func.count(User.id), func.min(User.id))
+            .where(User.stripe_customer_id.is_not(None))
+            .group_by(User.stripe_customer_id)
+            .having(func.count(User.id) > 1)
+        ).all()
+        for customer_id, n, keep_id in dupes:
+            print(f"Duplicate stripe_customer_id {customer_id}: {n} users (keeping user {keep_id})")
+
+        if dupes and os.getenv("FIX_DUPLICATE_STRIPE_CUSTOMERS"):
+            for customer_id, _, keep_id in dupes:
+                db.session.execute(
+                    update(User)
+                    .where(User.stripe_customer_id == customer_id, User.id != keep_id)
+                    .values(stripe_customer_id=None)
+                )
+            db.session.commit()
+            dupes = []
+
+        if dupes:
+            print(f"Skipped {index_name}; rerun with FIX_DUPLICATE_STRIPE_CUSTOMERS=1 to clear the extras.")
+        else:
+            next(ix for ix in User.__table__.indexes if ix.name == index_name).create(db.engine)
+            print(f"Created {index_name}")
+
+    # Inspect tables (an extra catalog query; opt in with VERBOSE=1)
+    if os.getenv("VERBOSE"):
+        tables = inspect(db.engine).get_table_names()
+        print("Tables in DB:", tables)
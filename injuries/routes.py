@@ -1,9 +1,11 @@
 from __future__ import annotations
 
+import operator
+import re
 import threading
 import time
-import xml.etree.ElementTree as ET
 from datetime import datetime
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional
 
 import requests
@@ -22,20 +24,38 @@ from lineups.routes import (
     _cookie_header_for_host,
     _effective_current_week,
     _league_host,
+    _parallel_map,
     _pick_year_for_week_lookup,
     _require_recent_sync_or_gate,
 )
 from models import League, Player, Roster, Team
+from services.mfl_http import iter_xml, make_mfl_session
 
 CACHE_KEY = "injuries_cache_v1"
 CACHE_TTL_SECONDS = 15 * 60
-_SERVER_CACHE: dict[tuple[str, int, int], tuple[float, dict[str, Any]]] = {}
-_SERVER_CACHE_LOCK = threading.Lock()
+CACHE_TTL_MINUTES = CACHE_TTL_SECONDS // 60
+# Bounded TTL cache split into lock shards, so unrelated users don't contend
+# on one lock. Each shard is a dict in insertion order (oldest first).
+SERVER_CACHE_MAX_ENTRIES = 4096
+_SERVER_CACHE_SHARD_COUNT = 16
+_SERVER_CACHE_SHARD_MAX = SERVER_CACHE_MAX_ENTRIES // _SERVER_CACHE_SHARD_COUNT
+_SERVER_CACHE_SHARDS: list[dict[tuple[str, int, int], tuple[float, dict[str, Any]]]] = [
+    {} for _ in range(_SERVER_CACHE_SHARD_COUNT)
+]
+_SERVER_CACHE_LOCKS = [threading.Lock() for _ in range(_SERVER_CACHE_SHARD_COUNT)]
+# Single-flight: one in-progress _build_payload per cache key; others wait
+_INFLIGHT: dict[tuple[str, int, int], threading.Event] = {}
+_INFLIGHT_LOCK = threading.Lock()
+INFLIGHT_WAIT_SECONDS = 30
 HEADERS_XML = {
     "User-Agent": "FantasyHub/1.0 (+injury-assist)",
     "Accept": "application/xml,text/xml,*/*;q=0.8",
 }
 
+
+# Shared keep-alive session for MFL exports (see services.mfl_http)
+_HTTP = make_mfl_session(retries=2)
+
 ROSTER_STATUS_LABELS = {
     "S": "Starter",
     "NS": "Non starter",
@@ -46,6 +66,20 @@ ROSTER_STATUS_LABELS = {
 
 HIGHLIGHT_RED_KEYWORDS = {"out", "suspended", "doubtful", "o", "d"}
 
+# Severity (lower is more severe): exact tokens first, prefix/substring rules
+# as a fallback for longer MFL strings like "Out (Knee)" or "PUP-R"
+_SEVERITY_BY_TOKEN = {
+    **{k: 0 for k in HIGHLIGHT_RED_KEYWORDS},
+    "ir": 0,
+    "questionable": 1,
+    "q": 1,
+}
+_RED_RE = re.compile(r"^(?:out|suspended|doubtful|ir)|pup")
+_YELLOW_RE = re.compile(r"^questionable")
+_HIGHLIGHT_BY_SEVERITY = {0: "red", 1: "yellow"}
+# Player order within a league: red, yellow, other starters, everyone else
+_SORT_RANK_BY_HIGHLIGHT = {"red": 0, "yellow": 1}
+
 
 injuries_bp = Blueprint(
     "injuries",
@@ -58,7 +92,14 @@ injuries_bp = Blueprint(
 def _normalize_player_id(value: Any) -> Optional[str]:
     if value is None:
         return None
-    text = str(value).strip()
+    return _normalize_player_id_str(value if isinstance(value, str) else str(value))
+
+
+@lru_cache(maxsize=65536)
+def _normalize_player_id_str(value: str) -> Optional[str]:
+    # The set of MFL player ids is small and bounded, so this is nearly
+    # always a cache hit after the first report
+    text = value.strip()
     if not text:
         return None
     try:
@@ -68,28 +109,6 @@ def _normalize_player_id(value: Any) -> Optional[str]:
         return text
 
 
-def _highlight_for(injury_status: str | None, roster_status: str | None) -> str:
-    if not injury_status or (roster_status or "").upper() != "S":
-        return ""
-
-    lowered = injury_status.strip().lower()
-    if not lowered:
-        return ""
-
-    if (
-        lowered in HIGHLIGHT_RED_KEYWORDS
-        or lowered.startswith("out")
-        or lowered.startswith("suspended")
-        or lowered.startswith("doubtful")
-    ):
-        return "red"
-    if lowered.startswith("ir") or "pup" in lowered:
-        return "red"
-    if lowered in {"questionable", "q"} or lowered.startswith("questionable"):
-        return "yellow"
-    return ""
-
-
 def _status_severity(injury_status: str | None) -> int:
     """Rank injury statuses for sorting (lower is more severe)."""
 
@@ -100,25 +119,23 @@ def _status_severity(injury_status: str | None) -> int:
     if not lowered:
         return 2
 
-    if (
-        lowered in HIGHLIGHT_RED_KEYWORDS
-        or lowered.startswith("out")
-        or lowered.startswith("suspended")
-        or lowered.startswith("doubtful")
-        or lowered.startswith("ir")
-        or "pup" in lowered
-    ):
-        return 0
-    if lowered in {"questionable", "q"} or lowered.startswith("questionable"):
-        return 1
-    return 2
+    severity = _SEVERITY_BY_TOKEN.get(lowered)
+    if severity is None:
+        if _RED_RE.search(lowered):
+            severity = 0
+        elif _YELLOW_RE.match(lowered):
+            severity = 1
+        else:
+            severity = 2
+    return severity
 
 
-def _league_priority(entry: dict[str, Any]) -> tuple[int, int, int, str]:
-    severity = int(entry.get("league_severity", 99))
-    red_count = int(entry.get("red_count", 0))
-    yellow_count = int(entry.get("yellow_count", 0))
-    return (severity, -red_count, -yellow_count, entry.get("league_name", ""))
+def _classify(injury_status: str | None, is_starter: bool) -> tuple[int, str]:
+    """(severity, highlight) in one pass; only starters get a highlight colour."""
+    severity = _status_severity(injury_status)
+    if not is_starter:
+        return severity, ""
+    return severity, _HIGHLIGHT_BY_SEVERITY.get(severity, "")
 
 
 def _cache_key_for_current_user(year: int | str, week: int | str) -> Optional[tuple[str, int, int]]:
@@ -137,19 +154,27 @@ def _cache_key_for_current_user(year: int | str, week: int | str) -> Optional[tu
         return None
 
 
+def _server_cache_shard(
+    cache_key: tuple[str, int, int],
+) -> tuple[dict[tuple[str, int, int], tuple[float, dict[str, Any]]], threading.Lock]:
+    i = hash(cache_key) % _SERVER_CACHE_SHARD_COUNT
+    return _SERVER_CACHE_SHARDS[i], _SERVER_CACHE_LOCKS[i]
+
+
 def _get_server_cached_payload(
     cache_key: Optional[tuple[str, int, int]], now_ts: float
 ) -> Optional[dict[str, Any]]:
     if not cache_key:
         return None
 
-    with _SERVER_CACHE_LOCK:
-        entry = _SERVER_CACHE.get(cache_key)
+    shard, lock = _server_cache_shard(cache_key)
+    with lock:
+        entry = shard.get(cache_key)
         if not entry:
             return None
         cached_ts, payload = entry
         if now_ts - cached_ts >= CACHE_TTL_SECONDS:
-            _SERVER_CACHE.pop(cache_key, None)
+            shard.pop(cache_key, None)
             return None
         return payload
 
@@ -159,15 +184,62 @@ def _store_server_cached_payload(
 ) -> None:
     if not cache_key:
         return
-    with _SERVER_CACHE_LOCK:
-        _SERVER_CACHE[cache_key] = (ts, payload)
+    shard, lock = _server_cache_shard(cache_key)
+    with lock:
+        # Re-insert so the key moves to the newest end
+        shard.pop(cache_key, None)
+        if len(shard) >= _SERVER_CACHE_SHARD_MAX:
+            # Entries nobody re-read would otherwise live forever: drop the
+            # expired ones, then the oldest if the shard is still full
+            for k in [k for k, (cached_ts, _) in shard.items() if ts - cached_ts >= CACHE_TTL_SECONDS]:
+                del shard[k]
+            while len(shard) >= _SERVER_CACHE_SHARD_MAX:
+                del shard[next(iter(shard))]
+        shard[cache_key] = (ts, payload)
 
 
 def _clear_server_cached_payload(cache_key: Optional[tuple[str, int, int]]) -> None:
     if not cache_key:
         return
-    with _SERVER_CACHE_LOCK:
-        _SERVER_CACHE.pop(cache_key, None)
+    shard, lock = _server_cache_shard(cache_key)
+    with lock:
+        shard.pop(cache_key, None)
+
+
+def _build_payload_single_flight(
+    cache_key: Optional[tuple[str, int, int]], year: int, week: int
+) -> dict[str, Any]:
+    """
+    Build and server-cache the payload for ``cache_key``. Concurrent misses
+    for the same key wait for the first builder instead of repeating the MFL
+    fetches; if that build fails (or takes too long) they build their own.
+    """
+    if not cache_key:
+        return _build_payload(year, week)
+
+    with _INFLIGHT_LOCK:
+        event = _INFLIGHT.get(cache_key)
+        leader = event is None
+        if leader:
+            event = _INFLIGHT[cache_key] = threading.Event()
+
+    if not leader:
+        event.wait(timeout=INFLIGHT_WAIT_SECONDS)
+        payload = _get_server_cached_payload(cache_key, time.time())
+        if payload is not None:
+            return payload
+        payload = _build_payload(year, week)
+        _store_server_cached_payload(cache_key, payload, time.time())
+        return payload
+
+    try:
+        payload = _build_payload(year, week)
+        _store_server_cached_payload(cache_key, payload, time.time())
+        return payload
+    finally:
+        with _INFLIGHT_LOCK:
+            _INFLIGHT.pop(cache_key, None)
+        event.set()
 
 
 def _fetch_injuries(year: int, week: int) -> tuple[dict[str, dict[str, str]], dict[str, Any]]:
@@ -179,42 +251,44 @@ def _fetch_injuries(year: int, week: int) -> tuple[dict[str, dict[str, str]], di
     if cookie:
         headers["Cookie"] = cookie
 
-    resp = requests.get(url, params=params, headers=headers, timeout=20)
-    resp.raise_for_status()
-
-    try:
-        root = ET.fromstring(resp.content)
-    except ET.ParseError:
-        root = ET.Element("injuries")
-
+    root_attrib: dict[str, str] = {}
     injuries_map: dict[str, dict[str, str]] = {}
-    for injury in root.findall("injury"):
-        pid = _normalize_player_id(injury.get("id"))
-        if not pid:
-            continue
-        injuries_map[pid] = {
-            "status": injury.get("status", "") or "",
-            "details": injury.get("details", "") or "",
-            "exp_return": injury.get("exp_return", "") or "",
-        }
+    # Parse straight off the socket rather than buffering resp.content first
+    with _HTTP.get(url, params=params, headers=headers, timeout=20, stream=True) as resp:
+        resp.raise_for_status()
+        resp.raw.decode_content = True
+        for injury in iter_xml(resp.raw, "injury", root_attrib):
+            pid = _normalize_player_id(injury.get("id"))
+            if not pid:
+                continue
+            injuries_map[pid] = {
+                "status": injury.get("status", "") or "",
+                "details": injury.get("details", "") or "",
+                "exp_return": injury.get("exp_return", "") or "",
+            }
 
     meta: dict[str, Any] = {
-        "week": _normalize_player_id(root.get("week")) or str(week),
-        "timestamp": root.get("timestamp"),
+        "week": _normalize_player_id(root_attrib.get("week")) or str(week),
+        "timestamp": root_attrib.get("timestamp"),
     }
     return injuries_map, meta
 
 
-def _fetch_roster_statuses(
+def _roster_status_request(
     *,
     league: League,
     player_ids: Iterable[str],
     year: int,
     week: int,
-) -> dict[str, str]:
-    ids = [pid for pid in {_normalize_player_id(p) for p in player_ids} if pid]
+) -> Optional[dict[str, Any]]:
+    """
+    Resolve everything the playerRosterStatus call needs from the league and
+    current_user up front, so the fetch itself can run on a worker thread.
+    ``player_ids`` are already normalised and unique (roster dict keys).
+    """
+    ids = list(player_ids)
     if not ids:
-        return {}
+        return None
 
     host = _league_host(league) or "api.myfantasyleague.com"
     url = f"https://{host}/{year}/export"
@@ -231,108 +305,150 @@ def _fetch_roster_statuses(
     if cookie:
         headers["Cookie"] = cookie
 
-    resp = requests.get(url, params=params, headers=headers, timeout=20)
-    resp.raise_for_status()
+    return {
+        "url": url,
+        "params": params,
+        "headers": headers,
+        "target_franchise": str(league.franchise_id or "").strip(),
+    }
 
-    try:
-        root = ET.fromstring(resp.content)
-    except ET.ParseError:
-        root = ET.Element("playerRosterStatuses")
 
-    status_map: dict[str, str] = {}
-    target_franchise = str(league.franchise_id or "").strip()
+def _fetch_roster_statuses(req: Optional[dict[str, Any]]) -> dict[str, str]:
+    """Run a prepared playerRosterStatus request (no app/request context needed)."""
+    if not req:
+        return {}
 
-    for node in root.findall("playerStatus"):
-        pid = _normalize_player_id(node.get("id"))
-        if not pid:
-            continue
-        roster_status = None
-        for roster_node in node.findall("roster_franchise"):
-            fid = str(roster_node.get("franchise_id") or "").strip()
-            if target_franchise and fid != target_franchise:
+    status_map: dict[str, str] = {}
+    target_franchise = req["target_franchise"]
+
+    with _HTTP.get(
+        req["url"], params=req["params"], headers=req["headers"], timeout=20, stream=True
+    ) as resp:
+        resp.raise_for_status()
+        resp.raw.decode_content = True
+        for node in iter_xml(resp.raw, "playerStatus"):
+            pid = _normalize_player_id(node.get("id"))
+            if not pid:
                 continue
-            roster_status = roster_node.get("status")
+            # One child walk; the fallback reuses it instead of find()-ing again
+            children = node.findall("roster_franchise")
+            if not children:
+                continue
+            roster_status = None
+            for roster_node in children:
+                fid = (roster_node.get("franchise_id") or "").strip()
+                if target_franchise and fid != target_franchise:
+                    continue
+                roster_status = roster_node.get("status")
+                if roster_status:
+                    break
+            if roster_status is None:
+                roster_status = children[0].get("status")
             if roster_status:
-                break
-        if roster_status is None and node.find("roster_franchise") is not None:
-            roster_status = node.find("roster_franchise").get("status")
-        if roster_status:
-            status_map[pid] = roster_status
+                status_map[pid] = roster_status
 
     return status_map
 
 
-def _gather_league_players(league: League) -> list[dict[str, Any]]:
-    team: Optional[Team] = (
-        db.session.query(Team)
-        .filter(Team.league_id == league.id, Team.mfl_id == league.franchise_id)
-        .first()
+def _gather_league_players(leagues: List[League]) -> dict[int, dict[str, dict[str, Any]]]:
+    """
+    The user's rostered players for every league, keyed by league id and then
+    normalised MFL id. Two queries in total (teams, then rosters), not two per
+    league.
+    """
+    by_league: dict[int, dict[str, dict[str, Any]]] = {lg.id: {} for lg in leagues}
+    if not leagues:
+        return by_league
+
+    # The user's own team in each league (franchise_id); first match wins
+    team_rows = (
+        db.session.query(Team.id, Team.league_id)
+        .join(League, League.id == Team.league_id)
+        .filter(Team.league_id.in_(list(by_league)), Team.mfl_id == League.franchise_id)
+        .order_by(Team.id.asc())
+        .all()
     )
-    if not team:
-        return []
-
-    rows: List[tuple[Roster, Player]] = (
-        db.session.query(Roster, Player)
+    team_by_league: dict[int, int] = {}
+    for team_id, league_id in team_rows:
+        team_by_league.setdefault(league_id, team_id)
+    league_by_team = {team_id: league_id for league_id, team_id in team_by_league.items()}
+    if not league_by_team:
+        return by_league
+
+    rows = (
+        db.session.query(
+            Roster.team_id, Player.mfl_id, Player.name, Player.position, Player.team
+        )
         .join(Player, Player.id == Roster.player_id)
-        .filter(Roster.team_id == team.id)
+        .filter(Roster.team_id.in_(list(league_by_team)))
         .all()
     )
 
-    players: List[dict[str, Any]] = []
-    for roster_row, player in rows:
-        pid = _normalize_player_id(player.mfl_id)
+    for team_id, mfl_id, name, position, nfl_team in rows:
+        pid = _normalize_player_id(mfl_id)
         if not pid:
             continue
-        players.append(
-            {
-                "player_id": pid,
-                "name": player.name or "Unknown",
-                "position": player.position or "",
-                "team": player.team or "",
-            }
-        )
-    return players
+        by_league[league_by_team[team_id]][pid] = {
+            "player_id": pid,
+            "name": name or "Unknown",
+            "position": position or "",
+            "team": nfl_team or "",
+        }
+    return by_league
 
 
 def _build_payload(year: int, week: int) -> dict[str, Any]:
     injuries_map, meta = _fetch_injuries(year, week)
 
+    # An empty injury report can't produce any blocks; skip the DB work too
     leagues: List[League] = (
         db.session.query(League)
         .filter(League.user_id == current_user.id)
         .order_by(League.name.asc())
         .all()
-    )
-
-    league_blocks: List[dict[str, Any]] = []
+    ) if injuries_map else []
+
+    # DB work and request prep stay on this thread; the per-league MFL calls
+    # are independent, so they go out in parallel.
+    league_rosters: List[tuple[League, dict[str, dict[str, Any]], List[str]]] = []
+    status_requests: List[Optional[dict[str, Any]]] = []
+    rosters_by_league = _gather_league_players(leagues)
+    # Set-like view, hoisted so every league filters against the same object
+    injury_keys = injuries_map.keys()
     for league in leagues:
-        roster_players = _gather_league_players(league)
-        roster_ids = [p["player_id"] for p in roster_players]
-        injured_ids = [pid for pid in roster_ids if pid in injuries_map]
-
-        status_map = _fetch_roster_statuses(
-            league=league, player_ids=injured_ids, year=year, week=week
+        roster_by_id = rosters_by_league[league.id]
+        # The only membership pass; the build loop below walks injured_ids as-is
+        injured_ids = [pid for pid in roster_by_id if pid in injury_keys]
+        if not injured_ids:
+            # Nothing to show for this league, so no playerRosterStatus call
+            continue
+        league_rosters.append((league, roster_by_id, injured_ids))
+        status_requests.append(
+            _roster_status_request(
+                league=league, player_ids=injured_ids, year=year, week=week
+            )
         )
 
+    # Concurrency comes from the shared MFL fan-out cap (LINEUPS_MAX_WORKERS)
+    status_maps = _parallel_map(_fetch_roster_statuses, status_requests)
+
+    league_blocks: List[dict[str, Any]] = []
+    for (league, roster_by_id, injured_ids), status_map in zip(league_rosters, status_maps):
         players_output: List[dict[str, Any]] = []
         severity_scores: List[int] = []
         red_count = 0
         yellow_count = 0
         starter_count = 0
-        for player in roster_players:
-            pid = player["player_id"]
-            if pid not in injuries_map:
-                continue
+        # Only the injured subset; everyone else on the roster is skipped outright
+        for pid in injured_ids:
+            player = roster_by_id[pid]
             injury_info = injuries_map[pid]
             roster_status = status_map.get(pid, "")
+            status_code = (roster_status or "").upper()
+            is_starter = status_code == "S"
             injury_status = injury_info.get("status")
-            highlight = _highlight_for(injury_status, roster_status)
-            severity = _status_severity(injury_status)
-            if (roster_status or "").upper() == "S":
-                severity_scores.append(severity)
-            else:
-                severity_scores.append(2)
-            is_starter = (roster_status or "").upper() == "S"
+            severity, highlight = _classify(injury_status, is_starter)
+            severity_scores.append(severity if is_starter else 2)
             if is_starter:
                 starter_count += 1
             if highlight == "red":
@@ -346,27 +462,16 @@ def _build_payload(year: int, week: int) -> dict[str, Any]:
                     "injury_details": injury_info.get("details", ""),
                     "expected_return": injury_info.get("exp_return", ""),
                     "roster_status": roster_status,
-                    "roster_status_label": ROSTER_STATUS_LABELS.get(
-                        (roster_status or "").upper(), (roster_status or "").upper()
-                    ),
+                    "roster_status_label": ROSTER_STATUS_LABELS.get(status_code, status_code),
                     "highlight": highlight,
                     "is_starter": is_starter,
                     "severity": severity,
+                    "sort_rank": _SORT_RANK_BY_HIGHLIGHT.get(highlight, 2 if is_starter else 3),
                 }
             )
 
-        def _priority(entry: dict[str, Any]) -> tuple[int, str]:
-            color = entry.get("highlight")
-            is_starter_entry = entry.get("is_starter", False)
-            if color == "red":
-                return (0, entry.get("name", ""))
-            if color == "yellow":
-                return (1, entry.get("name", ""))
-            if is_starter_entry:
-                return (2, entry.get("name", ""))
-            return (3, entry.get("name", ""))
-
-        players_output.sort(key=_priority)
+        # Keys were computed in the pass above; itemgetter keeps the sort in C
+        players_output.sort(key=operator.itemgetter("sort_rank", "name"))
 
         if not players_output:
             continue
@@ -379,12 +484,20 @@ def _build_payload(year: int, week: int) -> dict[str, Any]:
                 "league_name": league.name,
                 "league_year": league.year,
                 "league_mfl_id": league.mfl_id,
+                # Resolved here so cached payloads render as-is (week is in the cache key)
+                "submit_url": url_for(
+                    "lineups.lineups_single_league", league_id=league.id, week=week
+                ),
                 "players": players_output,
+                # Pre-split so the template doesn't re-filter players per render
+                "starters": [p for p in players_output if p["is_starter"]],
+                "bench": [p for p in players_output if not p["is_starter"]],
                 "league_severity": league_severity,
                 "red_count": red_count,
                 "yellow_count": yellow_count,
                 "starter_count": starter_count,
                 "player_count": len(players_output),
+                "sort_key": (league_severity, -red_count, -yellow_count, league.name or ""),
             }
         )
 
@@ -398,7 +511,7 @@ def _build_payload(year: int, week: int) -> dict[str, Any]:
     except Exception:
         injury_timestamp = None
 
-    league_blocks.sort(key=_league_priority)
+    league_blocks.sort(key=operator.itemgetter("sort_key"))
 
     return {
         "generated_at": fetched_at,
@@ -408,6 +521,16 @@ def _build_payload(year: int, week: int) -> dict[str, Any]:
     }
 
 
+def _empty_payload(week: int) -> dict[str, Any]:
+    """Payload shape for when nothing could be built or served from cache."""
+    return {
+        "generated_at": None,
+        "injury_report_week": str(week),
+        "injury_report_timestamp": None,
+        "leagues": [],
+    }
+
+
 @injuries_bp.route("/")
 @login_required
 def injuries_index():
@@ -448,15 +571,13 @@ def injuries_index():
 
     if payload is None:
         try:
-            payload = _build_payload(year, week)
-            fresh_ts = time.time()
+            payload = _build_payload_single_flight(cache_key, year, week)
             session[CACHE_KEY] = {
-                "ts": fresh_ts,
+                "ts": time.time(),
                 "week": int(week),
                 "year": int(year),
             }
             session.modified = True
-            _store_server_cached_payload(cache_key, payload, fresh_ts)
         except requests.RequestException:
             current_app.logger.exception("Failed to refresh injuries feed")
             error_message = "Could not refresh injury data from MFL right now. Showing the last cached results if available."
@@ -465,33 +586,11 @@ def injuries_index():
                 payload = cached_payload
                 used_cache = True
             else:
-                payload = {
-                    "generated_at": None,
-                    "injury_report_week": str(week),
-                    "injury_report_timestamp": None,
-                    "leagues": [],
-                }
+                payload = _empty_payload(week)
         except Exception:
             current_app.logger.exception("Unexpected error while building injury report")
             error_message = "Unexpected error while building injury report. Please try again later."
-            payload = {
-                "generated_at": None,
-                "injury_report_week": str(week),
-                "injury_report_timestamp": None,
-                "leagues": [],
-            }
-
-    display_leagues: List[dict[str, Any]] = []
-    for block in payload.get("leagues", []):
-        block_copy = dict(block)
-        block_copy["submit_url"] = (
-            ""
-            if not block.get("league_pk")
-            else url_for(
-                "lineups.lineups_single_league", league_id=block["league_pk"], week=week
-            )
-        )
-        display_leagues.append(block_copy)
+            payload = _empty_payload(week)
 
     if error_message:
         flash(error_message, "warning")
@@ -500,7 +599,7 @@ def injuries_index():
         "injuries/index.html",
         year=year,
         week=week,
-        payload={**payload, "leagues": display_leagues},
-        cache_ttl_minutes=CACHE_TTL_SECONDS // 60,
+        payload=payload,
+        cache_ttl_minutes=CACHE_TTL_MINUTES,
         used_cache=used_cache,
     )
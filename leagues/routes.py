@@ -1,7 +1,10 @@
 # leagues/routes.py
+import json
+
 from flask import Blueprint, render_template, jsonify, abort, current_app
 from flask_login import login_required, current_user
 from sqlalchemy import asc
+from sqlalchemy.orm import joinedload
 
 from app import db
 from models import League, Team, Player, Roster, DraftPick
@@ -20,15 +23,20 @@ def my_leagues():
         .all()
     )
 
-    # map: league_id -> the user's team in that league (by franchise_id)
-    my_teams = {}
-    for lg in leagues:
-        my_team = None
-        if lg.franchise_id:
-            my_team = Team.query.filter_by(
-                league_id=lg.id, mfl_id=lg.franchise_id
-            ).first()
-        my_teams[lg.id] = my_team
+    # map: league_id -> the user's team in that league (by franchise_id),
+    # resolved for every league in one joined query
+    my_teams = {lg.id: None for lg in leagues}
+    if leagues:
+        team_rows = (
+            Team.query
+            .join(League, League.id == Team.league_id)
+            .filter(League.user_id == current_user.id, Team.mfl_id == League.franchise_id)
+            .order_by(Team.id.asc())
+            .all()
+        )
+        for t in team_rows:
+            if my_teams.get(t.league_id) is None:
+                my_teams[t.league_id] = t
 
     return render_template("my_leagues.html", leagues=leagues, my_teams=my_teams)
 
@@ -41,24 +49,31 @@ def league_details_json(league_id: int):
     Access is restricted to the logged-in owner of the league.
     """
     try:
-        league = League.query.filter_by(id=league_id, user_id=current_user.id).first()
+        # League + its teams in one round trip
+        league = (
+            League.query
+            .options(joinedload(League.teams))
+            .filter_by(id=league_id, user_id=current_user.id)
+            .first()
+        )
         if not league:
             abort(404)
 
-        # Teams ordered: ranked first, then by name
-        teams = (
-            Team.query
-            .filter_by(league_id=league.id)
-            .order_by(Team.standing.is_(None), asc(Team.standing), asc(Team.name))
-            .all()
+        # Teams ordered: ranked first, then by name (case-insensitive, like
+        # the MySQL collation the old ORDER BY used)
+        teams = sorted(
+            league.teams,
+            key=lambda t: (t.standing is None, t.standing or 0, (t.name or "").lower()),
         )
 
-        # My team (by franchise_id from myleagues)
+        # My team (by franchise_id from myleagues), picked from the loaded teams
         my_team = None
         if league.franchise_id:
-            my_team = Team.query.filter_by(
-                league_id=league.id, mfl_id=league.franchise_id
-            ).first()
+            my_team = min(
+                (t for t in league.teams if t.mfl_id == league.franchise_id),
+                key=lambda t: t.id,
+                default=None,
+            )
 
         # My roster (join to Player for details)
         roster_items = []
@@ -138,7 +153,12 @@ def league_details_json(league_id: int):
                 "draft_picks": len(draft_picks),
             }
         }
-        return jsonify(payload)
+        # Plain compact dumps: skips jsonify's key sorting and the provider's
+        # default() hook (everything here is already JSON-native)
+        return current_app.response_class(
+            json.dumps(payload, separators=(",", ":")),
+            mimetype="application/json",
+        )
 
     except Exception:
         current_app.logger.exception("league_details_json failed")
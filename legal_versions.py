@@ -4,14 +4,21 @@ Single source of truth for current legal document versions.
 Bump these constants whenever you materially update your docs.
 """
 
+from types import MappingProxyType
+from typing import Mapping
+
 TOS_VERSION = "2025-09-16"
 PRIVACY_VERSION = "2025-09-16"
 AUP_VERSION = "2025-09-16"
 
 
-def current_versions() -> dict[str, str]:
-    return {
-        "tos": TOS_VERSION,
-        "privacy": PRIVACY_VERSION,
-        "aup": AUP_VERSION,
-    }
+# Built once at import; read-only so callers can't mutate the shared copy
+_VERSIONS: Mapping[str, str] = MappingProxyType({
+    "tos": TOS_VERSION,
+    "privacy": PRIVACY_VERSION,
+    "aup": AUP_VERSION,
+})
+
+
+def current_versions() -> Mapping[str, str]:
+    return _VERSIONS
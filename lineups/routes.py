@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import concurrent.futures
+import itertools
+import json
 import re
-from datetime import datetime
+import threading
+import time
+from datetime import date, datetime
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import Dict, List, Tuple, Optional
 
-import requests
 from flask import (
     Blueprint,
     render_template,
@@ -15,12 +20,14 @@ from flask import (
     flash,
     current_app,
     session,
-    jsonify,
+    g,
 )
 from flask_login import login_required, current_user
+from sqlalchemy import and_, select, tuple_
 
 from app import db
-from models import League, Team, Player, Roster
+from models import League, Team, Player, Roster, User
+from services.mfl_http import MFL_MAX_WORKERS, make_mfl_session
 
 # Service helpers
 from services.lineups_service import (
@@ -39,16 +46,29 @@ lineups_bp = Blueprint("lineups", __name__, template_folder="../templates")
 # -------------------------- Config / knobs ----------------------------------
 
 MFL_MAX_WEEKS_FALLBACK = 18
-PARALLEL_WORKERS = 3  # mirror other mass API calls (tweak to 2-3 as desired)
+# Shared MFL fan-out cap (see services.mfl_http); override with LINEUPS_MAX_WORKERS
+PARALLEL_WORKERS = MFL_MAX_WORKERS
+
+# -------------------------- Shared HTTP session -----------------------------
+
+# One keep-alive session for every MFL call made from this blueprint (week
+# discovery, projections, lineup imports); safe to share across the
+# _parallel_map worker threads.
+_MFL_SESSION = make_mfl_session(retries=3)
 
 # -------------------------- Host & cookies ----------------------------------
 
+_SCHEME_RE = re.compile(r"^https?://")
+
+@lru_cache(maxsize=512)
 def _norm_host(h: Optional[str]) -> Optional[str]:
     if not h:
         return None
     h = h.strip()
-    h = re.sub(r"^https?://", "", h).rstrip("/")
-    return h or None
+    # Stored hosts are usually bare ("www43.myfantasyleague.com"); skip the regex then
+    if h[:4] == "http":
+        h = _SCHEME_RE.sub("", h)
+    return h.rstrip("/") or None
 
 def _league_host(league: League) -> Optional[str]:
     # Prefer explicit host fields you persist
@@ -69,13 +89,23 @@ def _league_host(league: League) -> Optional[str]:
 def _cookie_header_for_host(host: str) -> Optional[str]:
     """
     Build a Cookie header string for the given host, reusing the same logic
-    you use in the trade flow.
+    you use in the trade flow. Memoized per request on `g`, since most of a
+    user's leagues share one host.
     """
     host = _norm_host(host) or ""
+    cache = g.setdefault("_mfl_cookie_by_host", {})
+    if host not in cache:
+        cache[host] = _build_cookie_header(host)
+    return cache[host]
+
+def _build_cookie_header(host: str, user=None) -> Optional[str]:
+    # Defaults to current_user; pool jobs pass a User loaded in their own context
+    if user is None:
+        user = current_user
     # If your User model exposes a helper, prefer that:
     try:
-        if hasattr(current_user, "get_mfl_cookie_header"):
-            s = current_user.get_mfl_cookie_header(host)  # type: ignore[attr-defined]
+        if hasattr(user, "get_mfl_cookie_header"):
+            s = user.get_mfl_cookie_header(host)  # type: ignore[attr-defined]
             if s:
                 return str(s)
     except Exception:
@@ -83,14 +113,14 @@ def _cookie_header_for_host(host: str) -> Optional[str]:
 
     # Legacy fallbacks
     for attr in ("mfl_cookie_api", "mfl_cookie"):
-        v = getattr(current_user, attr, None)
+        v = getattr(user, attr, None)
         if isinstance(v, dict) and v:
             return "; ".join(f"{k}={val}" for k, val in v.items())
         if isinstance(v, str) and v:
             return v
 
     for attr in ("session_key", "mfl_session"):
-        v = getattr(current_user, attr, None)
+        v = getattr(user, attr, None)
         if isinstance(v, str) and v:
             return f"MFLSESSION={v}"
 
@@ -122,14 +152,19 @@ def _pick_year_for_week_lookup() -> int:
     )
     return int(row[0]) if row and row[0] else datetime.now().year
 
-def _get_current_mfl_week(year: int) -> int:
-    cfg_week = current_app.config.get("MFL_CURRENT_WEEK")
-    if isinstance(cfg_week, int) and 1 <= cfg_week <= 22:
-        return cfg_week
+# year -> (fetched_at, week) for the nflSchedule lookup; the NFL week only
+# moves once a week, so one fetch per worker every few minutes is plenty.
+WEEK_CACHE_TTL_SECONDS = 10 * 60
+_WEEK_CACHE: Dict[int, Tuple[float, int]] = {}
+_WEEK_CACHE_LOCK = threading.Lock()
+_WEEK_REFRESHING: set[int] = set()
+
+def _fetch_current_week(year: int) -> Optional[int]:
+    """nflSchedule lookup; caches and returns the week, or None on any failure."""
     try:
         url = f"https://api.myfantasyleague.com/{year}/export"
         params = {"TYPE": "nflSchedule", "JSON": "1"}
-        r = requests.get(url, params=params, timeout=10)
+        r = _MFL_SESSION.get(url, params=params, timeout=10)
         r.raise_for_status()
         data = r.json()
         wk = (
@@ -139,9 +174,44 @@ def _get_current_mfl_week(year: int) -> int:
         )
         wk_i = int(str(wk))
         if 1 <= wk_i <= 22:
+            # Only real answers are cached; a failed lookup retries next call
+            with _WEEK_CACHE_LOCK:
+                _WEEK_CACHE[year] = (time.time(), wk_i)
             return wk_i
     except Exception:
         pass
+    return None
+
+def _refresh_week_in_background(year: int) -> None:
+    with _WEEK_CACHE_LOCK:
+        if year in _WEEK_REFRESHING:
+            return
+        _WEEK_REFRESHING.add(year)
+
+    def _run():
+        try:
+            _fetch_current_week(year)
+        finally:
+            with _WEEK_CACHE_LOCK:
+                _WEEK_REFRESHING.discard(year)
+
+    _shared_executor().submit(_run)
+
+def _get_current_mfl_week(year: int) -> int:
+    cfg_week = current_app.config.get("MFL_CURRENT_WEEK")
+    if isinstance(cfg_week, int) and 1 <= cfg_week <= 22:
+        return cfg_week
+    with _WEEK_CACHE_LOCK:
+        hit = _WEEK_CACHE.get(year)
+    if hit:
+        # Stale-while-revalidate: an expired answer is still served at once and
+        # refreshed off the request thread; only a cold cache waits on MFL
+        if time.time() - hit[0] >= WEEK_CACHE_TTL_SECONDS:
+            _refresh_week_in_background(year)
+        return hit[1]
+    wk = _fetch_current_week(year)
+    if wk is not None:
+        return wk
     return int(current_app.config.get("MFL_WEEK_FALLBACK", 1))
 
 def _effective_current_week(year: int) -> int:
@@ -160,27 +230,9 @@ def _effective_current_week(year: int) -> int:
     if wk < 1:
         wk = 1
 
-    try:
-        now = datetime.now()
-    except Exception:
-        now = None
-
-    if now:
-        if wk < 2 and now.month == 9 and now.day >= 8:
-            wk = 2
-
-        week3_start = None
-        try:
-            week3_start = datetime(year, 9, 16)
-        except Exception:
-            pass
-        if week3_start and now >= week3_start:
-            delta_weeks = (now - week3_start).days // 7
-            wk = max(wk, 3 + delta_weeks)
-
     minwk = current_app.config.get("MFL_MIN_CURRENT_WEEK")
-    if isinstance(minwk, int) and 1 <= minwk <= 22:
-        wk = max(wk, minwk)
+    if not (isinstance(minwk, int) and 1 <= minwk <= 22):
+        minwk = None
 
     try:
         max_week = int(current_app.config.get("MFL_MAX_WEEKS", MFL_MAX_WEEKS_FALLBACK))
@@ -189,6 +241,30 @@ def _effective_current_week(year: int) -> int:
     if max_week < 1:
         max_week = MFL_MAX_WEEKS_FALLBACK
 
+    return _calendar_week(year, wk, minwk, max_week, date.today())
+
+
+@lru_cache(maxsize=32)
+def _calendar_week(year: int, wk: int, minwk: Optional[int], max_week: int, today: date) -> int:
+    """
+    Pure date arithmetic behind _effective_current_week. Keyed on today's date,
+    so each (year, config) combination is computed once per day.
+    """
+    if wk < 2 and today.month == 9 and today.day >= 8:
+        wk = 2
+
+    week3_start = None
+    try:
+        week3_start = date(year, 9, 16)
+    except Exception:
+        pass
+    if week3_start and today >= week3_start:
+        delta_weeks = (today - week3_start).days // 7
+        wk = max(wk, 3 + delta_weeks)
+
+    if minwk is not None:
+        wk = max(wk, minwk)
+
     return max(1, min(wk, max_week))
 
 
@@ -201,39 +277,142 @@ def _allowed_weeks_from(current_week: int, max_week: int) -> List[int]:
 
 # ----------------------------- Utilities ------------------------------------
 
-def _user_synced_leagues() -> list[League]:
-    # Scope strictly to the current user's leagues
-    return (
-        db.session.query(League)
-        .filter(League.user_id == current_user.id)
+def _user_synced_leagues() -> list[SimpleNamespace]:
+    # Scope strictly to the current user's leagues. The batch flows only read
+    # these columns, so plain rows (no ORM identity-map bookkeeping) are
+    # enough; synced_at keys the roster cache.
+    rows = db.session.execute(
+        select(
+            League.id, League.user_id, League.mfl_id, League.name, League.year,
+            League.synced_at, League.roster_slots, League.franchise_id, League.league_host,
+        )
+        .where(League.user_id == current_user.id)
         .order_by(League.year.desc(), League.name.asc())
-        .all()
-    )
+    ).mappings().all()
+    return [SimpleNamespace(**r) for r in rows]
+
+_EXECUTOR: Optional[concurrent.futures.ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
 
-def _parallel_map(func, items, max_workers=PARALLEL_WORKERS):
-    if max_workers and max_workers > 1 and len(items) > 1:
-        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as ex:
-            return list(ex.map(func, items))
+def _max_workers_setting() -> int:
+    try:
+        n = int(current_app.config.get("LINEUPS_MAX_WORKERS", PARALLEL_WORKERS))
+    except Exception:
+        n = PARALLEL_WORKERS
+    return max(1, n)
+
+def _shared_executor() -> concurrent.futures.ThreadPoolExecutor:
+    """
+    One pool per process, created on first use, instead of spinning threads
+    up and down on every request. Its size is also the process-wide cap on
+    concurrent MFL calls made through _parallel_map.
+    """
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        size = _max_workers_setting()
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=size, thread_name_prefix="mfl-fanout"
+                )
+    return _EXECUTOR
+
+def _league_and_team_name(league_id_pk: int) -> Tuple[Optional[League], Optional[str]]:
+    """League plus my team's name (franchise match) in one round trip."""
+    row = db.session.execute(
+        select(League, Team.name)
+        .outerjoin(Team, and_(Team.league_id == League.id, Team.mfl_id == League.franchise_id))
+        .where(League.id == league_id_pk)
+        .order_by(Team.id)
+        .limit(1)
+    ).first()
+    return (row[0], row[1]) if row else (None, None)
+
+def _parallel_map(func, items, max_workers=None):
+    # Results come back in input order. func must not call _parallel_map itself
+    # (nested waits on the shared pool could starve it). At most max_workers
+    # of this call's items are in flight at once, whatever the pool size.
+    if max_workers is None:
+        max_workers = _max_workers_setting()
+    if min(len(items), max_workers) > 1:
+        ex = _shared_executor()
+        slots = threading.BoundedSemaphore(max_workers)
+        futures = []
+        for x in items:
+            slots.acquire()  # bounded submit window
+            f = ex.submit(func, x)
+            f.add_done_callback(lambda _f: slots.release())
+            futures.append(f)
+        return [f.result() for f in futures]
     return [func(x) for x in items]
 
+def _iter_completed(func, items, max_workers=None):
+    """
+    Like _parallel_map, but yields (item, result) pairs in completion order so
+    the caller can post-process each result while slower calls are in flight.
+    Keeps at most max_workers of this call's items in flight at once.
+    """
+    if max_workers is None:
+        max_workers = _max_workers_setting()
+    if min(len(items), max_workers) > 1:
+        ex = _shared_executor()
+        todo = iter(items)
+        pending = {ex.submit(func, x): x for x in itertools.islice(todo, max_workers)}
+        while pending:
+            done, _ = concurrent.futures.wait(
+                pending, return_when=concurrent.futures.FIRST_COMPLETED
+            )
+            for f in done:
+                x = pending.pop(f)
+                # refill the window before handing the result to the caller
+                for nxt in itertools.islice(todo, 1):
+                    pending[ex.submit(func, nxt)] = nxt
+                yield x, f.result()
+        return
+    for x in items:
+        yield x, func(x)
+
+def _parse_ids(vals: List[str]) -> List[int]:
+    """
+    Posted player ids -> ints in posted order, accepting exactly what int()
+    accepts (surrounding whitespace, a sign) and skipping the rest. Duplicates
+    are kept, as the submit routes always did.
+    """
+    out: List[int] = []
+    for v in vals:
+        try:
+            out.append(int(str(v)))
+        except Exception:
+            continue
+    return out
+
 # ---------------------- MFL status parsing (strip XML) ----------------------
 
 _STATUS_OK_RE = re.compile(r"<\s*status\s*>\s*OK\s*<\s*/\s*status\s*>", re.I)
+_XML_DECL_RE = re.compile(r"<\?xml[^>]*\?>", re.I)
+_STATUS_TAG_RE = re.compile(r"<\s*/?\s*status\s*>", re.I)
+_ANY_TAG_RE = re.compile(r"<[^>]+>")
 
 def _clean_mfl_message(text: str) -> str:
     """Strip XML/HTML and keep meaningful text."""
     if not text:
         return ""
-    t = text
     # remove xml decl
-    t = re.sub(r"<\?xml[^>]*\?>", "", t, flags=re.I).strip()
+    t = _XML_DECL_RE.sub("", text)
     # remove status tag itself (we infer success via code paths)
-    t = re.sub(r"<\s*/?\s*status\s*>", "", t, flags=re.I)
+    t = _STATUS_TAG_RE.sub("", t)
     # now strip any remaining tags
-    t = re.sub(r"<[^>]+>", " ", t)
-    # collapse whitespace
-    t = re.sub(r"\s+", " ", t).strip()
-    return t
+    t = _ANY_TAG_RE.sub(" ", t)
+    # collapse whitespace (split() also drops the ends)
+    return " ".join(t.split())
+
+def _json_response(obj: dict):
+    """
+    Compact JSON for the per-click rapid/single endpoints: a plain dumps skips
+    jsonify's key sorting and the provider's default() hook (payloads here are
+    already JSON-native). Return with a status as usual: `_json_response(x), 400`.
+    """
+    return current_app.response_class(json.dumps(obj, separators=(",", ":")), mimetype="application/json")
 
 def _is_ok_payload(text: str) -> bool:
     if not text:
@@ -278,57 +457,58 @@ def lineups_review():
         flash("No synced leagues found.", "warning")
         return redirect(url_for("lineups.lineups_index"))
 
+    # My team name per league (by franchise match only), one query for all leagues
+    pairs = [(lg.id, lg.franchise_id) for lg in leagues if lg.franchise_id]
+    name_by_lid: Dict[int, str] = {}
+    if pairs:
+        rows = (
+            db.session.query(Team.league_id, Team.name)
+            .filter(tuple_(Team.league_id, Team.mfl_id).in_(pairs))
+            .order_by(Team.id)
+            .all()
+        )
+        for league_id, name in rows:
+            name_by_lid.setdefault(league_id, name)
+
     # MAIN THREAD: gather DB + cookie data up front
     jobs: List[dict] = []
     for lg in leagues:
-        # Hard owner check
-        if getattr(lg, "user_id", None) != current_user.id:
-            continue
-
+        # Ownership: _user_synced_leagues() only returns this user's leagues
         host = _league_host(lg) or "api.myfantasyleague.com"
         cookie = _cookie_header_for_host(host)
 
         # Roster from DB
-        players = build_players_for_review(lg.id)  # [(pid, name, pos, team)]
+        players = build_players_for_review(lg.id, league=lg)  # [(pid, name, pos, team)]
         pid_list = [pid for (pid, _, _, _) in players]
 
-        # My team name (by franchise match only)
-        my_team_name = None
-        try:
-            team = (
-                db.session.query(Team)
-                .filter(Team.league_id == lg.id, Team.mfl_id == lg.franchise_id)
-                .first()
-            )
-            my_team_name = team.name if team else None
-        except Exception:
-            pass
-
         jobs.append(dict(
             league=lg,
             host=host,
             cookie=cookie,
             players=players,
             pid_list=pid_list,
-            my_team_name=my_team_name,
+            my_team_name=name_by_lid.get(lg.id),
             starters_label=(getattr(lg, "roster_slots", None) or ""),
         ))
 
     # THREADS: network projections only
     def _net_fetch(job: dict):
         lg: League = job["league"]
-        proj_map = fetch_projected_scores(
-            job["host"], lg.mfl_id, lg.year, week_i, job["pid_list"], cookie=job["cookie"]
+        return fetch_projected_scores(
+            job["host"], lg.mfl_id, lg.year, week_i, job["pid_list"],
+            cookie=job["cookie"], session=_MFL_SESSION,
         )
-        return (lg.id, proj_map)
 
-    proj_by_league_id = dict(_parallel_map(_net_fetch, jobs, max_workers=PARALLEL_WORKERS))
+    # MAIN THREAD: group each league as soon as its projections land
+    grouped_by_league_id: Dict[int, Dict[str, List[Dict[str, object]]]] = {}
+    for job, proj_map in _iter_completed(_net_fetch, jobs):
+        grouped_by_league_id[job["league"].id] = group_and_sort_players_for_review(job["players"], proj_map)
 
-    # MAIN THREAD: assemble view model
+    # MAIN THREAD: assemble view model (original league order)
     items: List[Dict[str, object]] = []
     for job in jobs:
         lg: League = job["league"]
-        grouped = group_and_sort_players_for_review(job["players"], proj_by_league_id.get(lg.id, {}))
+        grouped = grouped_by_league_id[lg.id]
         items.append(dict(
             league=lg,
             host=job["host"],
@@ -365,13 +545,7 @@ def lineups_submit():
     for lg in leagues:
         key = f"starters_{lg.id}"
         vals = request.form.getlist(f"{key}[]") or request.form.getlist(key)
-        picked: List[int] = []
-        for v in vals:
-            try:
-                picked.append(int(str(v)))
-            except Exception:
-                continue
-        selections[lg.id] = picked
+        selections[lg.id] = _parse_ids(vals)
         includes[lg.id] = (request.form.get(f"include_{lg.id}") == "1")
 
     # MAIN THREAD: capture host + cookie + guards up front
@@ -381,21 +555,13 @@ def lineups_submit():
         if not includes.get(lg.id, False):
             continue
 
-        # Hard owner check (skip anything not owned by this user)
-        if getattr(lg, "user_id", None) != current_user.id:
-            jobs.append(dict(
-                league=lg, host=None, cookie=None, starters=[],
-                force_result=dict(ok=False, message="Skipped: league not owned by current user")
-            ))
-            continue
-
+        # Ownership: _user_synced_leagues() only returns this user's leagues
         host = _league_host(lg) or "api.myfantasyleague.com"
         cookie = _cookie_header_for_host(host)
 
         # Intersect submitted starters with my roster to prevent injected IDs
-        allowed_ids = set(get_my_team_player_ids(lg.id))
-        submitted = selections.get(lg.id, [])
-        starters = [pid for pid in submitted if pid in allowed_ids]
+        allowed_ids = set(get_my_team_player_ids(lg.id, league=lg))
+        starters = [pid for pid in selections.get(lg.id, []) if pid in allowed_ids]
 
         if not starters:
             # Don't send an empty lineup (avoids clearing)
@@ -414,15 +580,15 @@ def lineups_submit():
     # THREADS: only network submission (or return forced result)
     def _submit_one(job: dict) -> Dict[str, object]:
         lg: League = job["league"]
-        # Forced result (not owned / no starters)
+        # Forced result (no starters)
         if job.get("force_result"):
             fr = job["force_result"]
             return dict(league=lg, ok=fr["ok"], message=fr["message"])
-        ok, raw = submit_lineup(job["host"], lg.mfl_id, lg.year, week_i, job["starters"], cookie=job["cookie"])
+        ok, raw = submit_lineup(job["host"], lg.mfl_id, lg.year, week_i, job["starters"], cookie=job["cookie"], session=_MFL_SESSION)
         # raw may include XML; keep as-is for batch page (legacy)
         return dict(league=lg, ok=ok, message=raw or ("Lineup submitted successfully" if ok else "Unknown response"))
 
-    results = _parallel_map(_submit_one, jobs, max_workers=PARALLEL_WORKERS)
+    results = _parallel_map(_submit_one, jobs)
 
     return render_template("lineups/summary.html", week=week_i, results=results)
 
@@ -442,15 +608,23 @@ def lineups_rapid_start():
             flash("Please select a valid week.", "warning")
             return redirect(url_for("lineups.lineups_rapid_start"))
 
-        leagues = _user_synced_leagues()
-        queue = [lg.id for lg in leagues if getattr(lg, "user_id", None) == current_user.id]
+        # Only ids go into the session queue
+        queue = list(
+            db.session.scalars(
+                select(League.id)
+                .where(League.user_id == current_user.id)
+                .order_by(League.year.desc(), League.name.asc())
+            )
+        )
         if not queue:
             flash("No synced leagues found.", "warning")
             return redirect(url_for("lineups.lineups_index"))
 
+        # rapid_queue holds only the leagues still to do, head first: done or
+        # skipped leagues are popped off, failures rotate to the back. The
+        # cookie session shrinks as the run progresses and no index is kept.
         session["rapid_week"] = week_i
         session["rapid_queue"] = queue
-        session["rapid_idx"] = 0
         session.pop("lineups_rapid_events", None)
         session["lineups_rapid_total"] = len(queue)
         session["lineups_rapid_success"] = 0
@@ -464,6 +638,66 @@ def lineups_rapid_start():
     return render_template("lineups/rapid_start.html", weeks=weeks, selected_week=current_week)
 
 
+# (user_id, league_pk, week) -> (started_at, Future[(pid tuple, projections)])
+# While the user works through one rapid-flow league, the next league's
+# projections are already being fetched. Per process: if the next page lands
+# on another worker it just misses and fetches normally.
+RAPID_PREFETCH_TTL_SECONDS = 5 * 60
+RAPID_PREFETCH_MAX_ENTRIES = 256
+_RAPID_PREFETCH: Dict[Tuple[int, int, int], Tuple[float, concurrent.futures.Future]] = {}
+_RAPID_PREFETCH_LOCK = threading.Lock()
+
+def _purge_rapid_prefetch(now: float) -> None:
+    # Caller holds _RAPID_PREFETCH_LOCK. Expired entries first, then the oldest inserted.
+    for k in [k for k, (ts, _) in _RAPID_PREFETCH.items() if now - ts >= RAPID_PREFETCH_TTL_SECONDS]:
+        del _RAPID_PREFETCH[k]
+    while len(_RAPID_PREFETCH) >= RAPID_PREFETCH_MAX_ENTRIES:
+        del _RAPID_PREFETCH[next(iter(_RAPID_PREFETCH))]
+
+def _rapid_prefetch_job(app, user_id: int, league_id_pk: int, week_i: int):
+    """Pool job: roster, cookie and projections for one league, in its own app context."""
+    with app.app_context():
+        lg: League | None = db.session.get(League, league_id_pk)
+        if not lg or getattr(lg, "user_id", None) != user_id:
+            return (), {}
+        user = db.session.get(User, user_id)
+        host = _league_host(lg) or "api.myfantasyleague.com"
+        cookie = _build_cookie_header(_norm_host(host) or "", user) if user else None
+        pid_list = [pid for (pid, _, _, _) in build_players_for_review(lg.id, league=lg)]
+        proj = fetch_projected_scores(
+            host, lg.mfl_id, lg.year, week_i, pid_list, cookie=cookie, session=_MFL_SESSION,
+        )
+        return tuple(pid_list), proj
+
+def _rapid_prefetch(league_id_pk: int, week_i: int) -> None:
+    """Start fetching projections for a queued league; all the work runs on the pool."""
+    key = (current_user.id, league_id_pk, week_i)
+    now = time.time()
+    with _RAPID_PREFETCH_LOCK:
+        _purge_rapid_prefetch(now)
+        if key in _RAPID_PREFETCH:
+            return
+        fut = _shared_executor().submit(
+            _rapid_prefetch_job, current_app._get_current_object(), current_user.id, league_id_pk, week_i,
+        )
+        _RAPID_PREFETCH[key] = (now, fut)
+
+def _rapid_projections(lg: League, week_i: int, host: str, cookie: Optional[str], pid_list: List[int]):
+    """Prefetched projections when they match this roster, else a direct fetch."""
+    now = time.time()
+    with _RAPID_PREFETCH_LOCK:
+        _purge_rapid_prefetch(now)
+        hit = _RAPID_PREFETCH.pop((current_user.id, lg.id, week_i), None)
+    if hit:
+        try:
+            pids, proj = hit[1].result()
+            if pids == tuple(pid_list):
+                return proj
+        except Exception:
+            pass  # fall through and retry on this thread
+    return fetch_projected_scores(host, lg.mfl_id, lg.year, week_i, pid_list, cookie=cookie, session=_MFL_SESSION)
+
+
 @lineups_bp.route("/lineups/rapid/league", methods=["GET"])
 @login_required
 def lineups_rapid_league():
@@ -472,16 +706,15 @@ def lineups_rapid_league():
         return gate
 
     queue: List[int] = session.get("rapid_queue") or []
-    idx: int = int(session.get("rapid_idx") or 0)
     week_i: Optional[int] = session.get("rapid_week")
 
-    if not queue or week_i is None or idx >= len(queue):
+    if not queue or week_i is None:
         return redirect(url_for("lineups.lineups_rapid_finish"))
 
-    league_id_pk = queue[idx]
-    lg: League | None = db.session.get(League, league_id_pk)
+    league_id_pk = queue[0]
+    lg, my_team_name = _league_and_team_name(league_id_pk)
     if not lg or getattr(lg, "user_id", None) != current_user.id:
-        session["rapid_idx"] = idx + 1
+        session["rapid_queue"] = queue[1:]
         session.modified = True
         return redirect(url_for("lineups.lineups_rapid_league"))
 
@@ -490,24 +723,17 @@ def lineups_rapid_league():
 
     players = build_players_for_review(lg.id)
     pid_list = [pid for (pid, _, _, _) in players]
-    proj_map = fetch_projected_scores(host, lg.mfl_id, lg.year, week_i, pid_list, cookie=cookie)
+    # Kick off the next league before waiting on this one
+    if len(queue) > 1:
+        _rapid_prefetch(queue[1], week_i)
+    proj_map = _rapid_projections(lg, week_i, host, cookie, pid_list)
 
     starters_label = getattr(lg, "roster_slots", None) or ""
     total_required, ranges = parse_lineup_requirements(starters_label)
     auto_ids = pick_optimal_lineup(players, proj_map, total_required, ranges)
     grouped = group_and_sort_players_for_review(players, proj_map)
 
-    my_team_name = None
-    try:
-        team = (
-            db.session.query(Team)
-            .filter(Team.league_id == lg.id, Team.mfl_id == lg.franchise_id)
-            .first()
-        )
-        my_team_name = team.name if team else None
-    except Exception:
-        pass
-
+    total_leagues = max(int(session.get("lineups_rapid_total") or 0), len(queue))
     return render_template(
         "lineups/rapid_league.html",
         week=week_i,
@@ -518,11 +744,16 @@ def lineups_rapid_league():
         ranges=ranges,
         grouped_players=grouped,
         auto_selected=set(auto_ids),
-        index=idx + 1,
-        total_leagues=len(queue),
+        index=total_leagues - len(queue) + 1,
+        total_leagues=total_leagues,
     )
 
 
+# The session is a signed cookie that is re-sent on every rapid submit, so
+# events are stored as compact [league_id, status, message, ts] rows and
+# league names are looked up once on the finish page instead.
+RAPID_EVENT_MESSAGE_MAX = 300
+
 def _record_rapid_event(league: League, status: str, message: str):
     """
     Append an event to session for the finish page, grouped per league.
@@ -530,13 +761,10 @@ def _record_rapid_event(league: League, status: str, message: str):
     """
     events = session.get("lineups_rapid_events") or []
     ts = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    events.append({
-        "league_id": league.id,
-        "league_name": league.name,
-        "status": status,
-        "message": _clean_mfl_message(message or ""),
-        "ts": ts,
-    })
+    msg = _clean_mfl_message(message or "")
+    if len(msg) > RAPID_EVENT_MESSAGE_MAX:
+        msg = msg[:RAPID_EVENT_MESSAGE_MAX] + " …"
+    events.append([league.id, status, msg, ts])
     session["lineups_rapid_events"] = events
 
     # update counters
@@ -550,58 +778,46 @@ def _record_rapid_event(league: League, status: str, message: str):
 def lineups_rapid_submit():
     gate = _require_recent_sync_or_gate()
     if gate:
-        return jsonify({"ok": False, "message": "Sync required. Please refresh leagues.", "next": False}), 400
+        return _json_response({"ok": False, "message": "Sync required. Please refresh leagues.", "next": False}), 400
 
     try:
         league_id_pk = int(str(request.form.get("league_id")))
         week_i = int(str(request.form.get("week")))
     except Exception:
-        return jsonify({"ok": False, "message": "Invalid request.", "next": False}), 400
+        return _json_response({"ok": False, "message": "Invalid request.", "next": False}), 400
 
     lg: League | None = db.session.get(League, league_id_pk)
     if not lg or getattr(lg, "user_id", None) != current_user.id:
-        return jsonify({"ok": False, "message": "League not found or not owned by you.", "next": False}), 404
+        return _json_response({"ok": False, "message": "League not found or not owned by you.", "next": False}), 404
 
     vals = request.form.getlist("starters[]") or request.form.getlist("starters")
-    submitted: List[int] = []
-    for v in vals:
-        try:
-            submitted.append(int(str(v)))
-        except Exception:
-            continue
-
     allowed_ids = set(get_my_team_player_ids(lg.id))
-    starters = [pid for pid in submitted if pid in allowed_ids]
+    starters = [pid for pid in _parse_ids(vals) if pid in allowed_ids]
     if not starters:
         _record_rapid_event(lg, "error", "No starters selected.")
-        return jsonify({"ok": False, "message": "No starters selected.", "next": False}), 400
+        return _json_response({"ok": False, "message": "No starters selected.", "next": False}), 400
 
     host = _league_host(lg) or "api.myfantasyleague.com"
     cookie = _cookie_header_for_host(host)
 
-    ok, raw = submit_lineup(host, lg.mfl_id, lg.year, week_i, starters, cookie=cookie)
+    ok, raw = submit_lineup(host, lg.mfl_id, lg.year, week_i, starters, cookie=cookie, session=_MFL_SESSION)
     msg = raw or ("OK" if ok else "Failed")
 
     queue: List[int] = session.get("rapid_queue") or []
-    idx: int = int(session.get("rapid_idx") or 0)
 
     if ok or _is_ok_payload(raw or ""):
         _record_rapid_event(lg, "submitted", msg)
-        # Success: advance pointer, keep order
-        session["rapid_idx"] = min(idx + 1, len(queue))
-        session.modified = True
+        # Success: pop the head, keep order
+        queue = queue[1:]
     else:
-        # Failure: move this league to the back; keep idx so next league is shown
+        # Failure: rotate the head to the back so the next league is shown
         _record_rapid_event(lg, "error", msg)
-        if idx < len(queue):
-            curr = queue[idx]
-            del queue[idx]
-            queue.append(curr)
-            session["rapid_queue"] = queue
-            session.modified = True
-
-    next_exists = (session.get("rapid_idx", 0) < len(session.get("rapid_queue") or []))
-    return jsonify({
+        queue = queue[1:] + queue[:1]
+    session["rapid_queue"] = queue
+    session.modified = True
+
+    next_exists = bool(queue)
+    return _json_response({
         "ok": bool(ok or _is_ok_payload(raw or "")),
         "message": _clean_mfl_message(msg),
         "next": next_exists,
@@ -613,17 +829,16 @@ def lineups_rapid_submit():
 @login_required
 def lineups_rapid_skip():
     queue: List[int] = session.get("rapid_queue") or []
-    idx: int = int(session.get("rapid_idx") or 0)
     # record skip for current league (if any)
-    if queue and idx < len(queue):
-        league_id_pk = queue[idx]
-        lg: League | None = db.session.get(League, league_id_pk)
+    if queue:
+        lg: League | None = db.session.get(League, queue[0])
         if lg:
             _record_rapid_event(lg, "skipped", "Skipped by user.")
-        session["rapid_idx"] = idx + 1
+        queue = queue[1:]
+        session["rapid_queue"] = queue
         session.modified = True
-    next_exists = (session.get("rapid_idx", 0) < len(queue))
-    return jsonify({"ok": True, "message": "Skipped.", "next": next_exists})
+    next_exists = bool(queue)
+    return _json_response({"ok": True, "message": "Skipped.", "next": next_exists})
 
 
 @lineups_bp.route("/lineups/rapid/finish")
@@ -632,33 +847,42 @@ def lineups_rapid_finish():
     week = session.get("rapid_week")
     total = session.get("lineups_rapid_total", 0)
     success = session.get("lineups_rapid_success", 0)
-    events = session.get("lineups_rapid_events") or []
+    # [league_id, status, message, ts] rows (see _record_rapid_event)
+    events = [e for e in (session.get("lineups_rapid_events") or []) if isinstance(e, list) and len(e) == 4]
+
+    # League names in one query, scoped to this user
+    league_ids = {int(e[0]) for e in events}
+    name_by_lid: Dict[int, str] = dict(
+        db.session.query(League.id, League.name)
+        .filter(League.id.in_(league_ids), League.user_id == current_user.id)
+        .all()
+    ) if league_ids else {}
 
     # Group by league
     grouped: Dict[int, Dict[str, object]] = {}
-    for e in events:
-        lid = int(e.get("league_id"))
+    for league_id, status, message, ts in events:
+        lid = int(league_id)
         if lid not in grouped:
             grouped[lid] = {
                 "league_id": lid,
-                "league_name": e.get("league_name") or str(lid),
+                "league_name": name_by_lid.get(lid) or str(lid),
                 "events": [],
             }
         grouped[lid]["events"].append({
-            "status": e.get("status"),
-            "message": e.get("message"),
-            "ts": e.get("ts"),
+            "status": status,
+            "message": message,
+            "ts": ts,
         })
 
     # Counts
-    submitted_count = sum(1 for e in events if e.get("status") == "submitted")
-    error_count     = sum(1 for e in events if e.get("status") == "error")
-    skipped_count   = sum(1 for e in events if e.get("status") == "skipped")
+    submitted_count = sum(1 for e in events if e[1] == "submitted")
+    error_count     = sum(1 for e in events if e[1] == "error")
+    skipped_count   = sum(1 for e in events if e[1] == "skipped")
 
     # Clear session keys used for rapid flow (keep toast persistence to browser storage)
     session.pop("rapid_week", None)
     session.pop("rapid_queue", None)
-    session.pop("rapid_idx", None)
+    session.pop("rapid_idx", None)  # runs started before the queue became head-first
     session.pop("lineups_rapid_total", None)
     session.pop("lineups_rapid_success", None)
     session.pop("lineups_rapid_events", None)
@@ -678,7 +902,7 @@ def lineups_rapid_finish():
 @lineups_bp.route("/lineups/ping", methods=["GET"])
 @login_required
 def lineups_ping():
-    return jsonify({"ok": True})
+    return _json_response({"ok": True})
 
 # ============================ Single-League flow =============================
 
@@ -695,7 +919,7 @@ def lineups_single_league(league_id: int):
     if gate:
         return gate
 
-    lg: League | None = db.session.get(League, league_id)
+    lg, my_team_name = _league_and_team_name(league_id)
     if not lg or getattr(lg, "user_id", None) != current_user.id:
         flash("League not found or not owned by you.", "warning")
         return redirect("/leagues")
@@ -718,24 +942,13 @@ def lineups_single_league(league_id: int):
 
     players = build_players_for_review(lg.id)
     pid_list = [pid for (pid, _, _, _) in players]
-    proj_map = fetch_projected_scores(host, lg.mfl_id, lg.year, selected_week, pid_list, cookie=cookie)
+    proj_map = fetch_projected_scores(host, lg.mfl_id, lg.year, selected_week, pid_list, cookie=cookie, session=_MFL_SESSION)
 
     starters_label = getattr(lg, "roster_slots", None) or ""
     total_required, ranges = parse_lineup_requirements(starters_label)
     auto_ids = pick_optimal_lineup(players, proj_map, total_required, ranges)
     grouped = group_and_sort_players_for_review(players, proj_map)
 
-    my_team_name = None
-    try:
-        team = (
-            db.session.query(Team)
-            .filter(Team.league_id == lg.id, Team.mfl_id == lg.franchise_id)
-            .first()
-        )
-        my_team_name = team.name if team else None
-    except Exception:
-        pass
-
     return render_template(
         "lineups/single_league.html",
         league=lg,
@@ -757,38 +970,31 @@ def lineups_single_league(league_id: int):
 def lineups_single_submit(league_id: int):
     gate = _require_recent_sync_or_gate()
     if gate:
-        return jsonify({"ok": False, "message": "Sync required. Please refresh leagues."}), 400
+        return _json_response({"ok": False, "message": "Sync required. Please refresh leagues."}), 400
 
     lg: League | None = db.session.get(League, league_id)
     if not lg or getattr(lg, "user_id", None) != current_user.id:
-        return jsonify({"ok": False, "message": "League not found or not owned by you."}), 404
+        return _json_response({"ok": False, "message": "League not found or not owned by you."}), 404
 
     try:
         week_i = int(str(request.form.get("week")))
     except Exception:
-        return jsonify({"ok": False, "message": "Missing or invalid week."}), 400
+        return _json_response({"ok": False, "message": "Missing or invalid week."}), 400
 
     vals = request.form.getlist("starters[]") or request.form.getlist("starters")
-    submitted: List[int] = []
-    for v in vals:
-        try:
-            submitted.append(int(str(v)))
-        except Exception:
-            continue
-
     allowed_ids = set(get_my_team_player_ids(lg.id))
-    starters = [pid for pid in submitted if pid in allowed_ids]
+    starters = [pid for pid in _parse_ids(vals) if pid in allowed_ids]
     if not starters:
-        return jsonify({"ok": False, "message": "No starters selected."}), 400
+        return _json_response({"ok": False, "message": "No starters selected."}), 400
 
     host = _league_host(lg) or "api.myfantasyleague.com"
     cookie = _cookie_header_for_host(host)
 
-    ok, raw = submit_lineup(host, lg.mfl_id, lg.year, week_i, starters, cookie=cookie)
+    ok, raw = submit_lineup(host, lg.mfl_id, lg.year, week_i, starters, cookie=cookie, session=_MFL_SESSION)
     clean = _clean_mfl_message(raw or ("OK" if ok else "Failed"))
     if ok or _is_ok_payload(raw or ""):
         # Success: tell client to go back to My Leagues
-        return jsonify({"ok": True, "message": clean, "redirect": request.args.get("next") or request.form.get("next") or "/leagues"})
+        return _json_response({"ok": True, "message": clean, "redirect": request.args.get("next") or request.form.get("next") or "/leagues"})
     else:
         # Error: keep user on the page; toast will persist
-        return jsonify({"ok": False, "message": clean})
+        return _json_response({"ok": False, "message": clean})
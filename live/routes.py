@@ -4,16 +4,18 @@ from __future__ import annotations
 import time
 from datetime import datetime, timezone
 from typing import Dict, Any, List, Optional
-from collections import defaultdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from threading import Lock, Semaphore
+from collections import OrderedDict, defaultdict
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
 
-from flask import Blueprint, render_template, current_app, session, redirect, url_for
+from flask import Blueprint, render_template, current_app, g, session, redirect, url_for
 from flask_login import login_required, current_user
 
 from app import db
 from models import League, Team, Player
 from services.mfl_client import MFLClient
+from services.mfl_http import MFL_MAX_WORKERS
 from services.mfl_live import parse_live_scoring, LiveMatchup  # type: ignore
 from services.guards import can_view_aggregate_detail  # <-- added
 
@@ -21,30 +23,100 @@ live_bp = Blueprint("live", __name__, url_prefix="/live")
 
 CACHE_KEY = "live_cache"
 STALE_SECONDS = 300  # 5 minutes
+PLAYER_LOOKUP_CHUNK = 1000  # ids per IN (...) query
 
 # --- lightweight server-side cache for live scoring (per-process) ---
-_LIVE_CACHE_STORE: dict[int, dict] = {}
+# LRU order: most recently read/written user at the end
+_LIVE_CACHE_STORE: OrderedDict[int, dict] = OrderedDict()
 _LIVE_CACHE_LOCK = Lock()
 _LIVE_CACHE_MAX_USERS = 200   # soft cap to avoid unbounded growth
 
 
 def _get_live_cache(user_id: int) -> dict | None:
+    """Fresh cached payload for a user, or None (stale entries are dropped here)."""
     with _LIVE_CACHE_LOCK:
-        return _LIVE_CACHE_STORE.get(user_id)
+        payload = _LIVE_CACHE_STORE.get(user_id)
+        if payload is None:
+            return None
+        if (_now_ts() - float(payload.get("ts", 0))) > STALE_SECONDS:
+            del _LIVE_CACHE_STORE[user_id]
+            return None
+        _LIVE_CACHE_STORE.move_to_end(user_id)
+        return payload
 
 
 def _set_live_cache(user_id: int, payload: dict) -> None:
     with _LIVE_CACHE_LOCK:
-        if len(_LIVE_CACHE_STORE) >= _LIVE_CACHE_MAX_USERS and user_id not in _LIVE_CACHE_STORE:
-            # simple eviction of an arbitrary (first) user to keep bounded
-            _LIVE_CACHE_STORE.pop(next(iter(_LIVE_CACHE_STORE)))
         _LIVE_CACHE_STORE[user_id] = payload
+        _LIVE_CACHE_STORE.move_to_end(user_id)
+        # evict least-recently-used users to stay bounded
+        while len(_LIVE_CACHE_STORE) > _LIVE_CACHE_MAX_USERS:
+            _LIVE_CACHE_STORE.popitem(last=False)
+
+
+# --- shared league-keyed cache of raw liveScoring XML (per-process) ---
+# key: (year, league mfl_id) -> (fetched_at, xml, Last-Modified). Independent
+# of the viewing user, so members of the same league share one MFL fetch;
+# orientation to "my" franchise happens at parse time. Stale entries are kept
+# (LRU-bounded) so the next fetch can be a conditional GET against them.
+_LEAGUE_CACHE_STORE: OrderedDict[tuple[int, str], tuple[float, bytes, str | None]] = OrderedDict()
+_LEAGUE_CACHE_LOCK = Lock()
+_LEAGUE_CACHE_MAX = 1000
+
+
+def _get_league_live_entry(key: tuple[int, str]) -> tuple[float, bytes, str | None] | None:
+    with _LEAGUE_CACHE_LOCK:
+        hit = _LEAGUE_CACHE_STORE.get(key)
+        if hit is not None:
+            _LEAGUE_CACHE_STORE.move_to_end(key)
+        return hit
+
+
+def _set_league_live_xml(key: tuple[int, str], xml: bytes, last_modified: str | None = None) -> None:
+    with _LEAGUE_CACHE_LOCK:
+        _LEAGUE_CACHE_STORE[key] = (_now_ts(), xml, last_modified)
+        _LEAGUE_CACHE_STORE.move_to_end(key)
+        while len(_LEAGUE_CACHE_STORE) > _LEAGUE_CACHE_MAX:
+            _LEAGUE_CACHE_STORE.popitem(last=False)
+
+
+def _drop_league_live_xml(key: tuple[int, str]) -> None:
+    with _LEAGUE_CACHE_LOCK:
+        _LEAGUE_CACHE_STORE.pop(key, None)
+
+
+# --- MFLClient per (year, host); clients are stateless apart from base URL ---
+_CLIENT_POOL: dict[tuple[int, str], MFLClient] = {}
+_CLIENT_POOL_LOCK = Lock()
+
+
+def _get_client(year: int, base_url: str) -> MFLClient:
+    key = (int(year), base_url)
+    with _CLIENT_POOL_LOCK:
+        client = _CLIENT_POOL.get(key)
+        if client is None:
+            client = _CLIENT_POOL[key] = MFLClient(year=year, base_url=base_url)
+        return client
 
 
 def _now_ts() -> float:
     return time.time()
 
 
+def _fmt_fetched_at(ts: float) -> str:
+    """Display string for a cache timestamp; formatted once, when the cache is built."""
+    return datetime.fromtimestamp(ts, tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+
+
+@lru_cache(maxsize=4096)
+def _pad4(fid: Any) -> str:
+    """Zero-padded 4-char franchise id ('6' / 6 -> '0006'); memoized, ids repeat a lot."""
+    try:
+        return f"{int(fid):04d}"
+    except (TypeError, ValueError):
+        return str(fid).zfill(4)
+
+
 def _league_host(lg: League) -> Optional[str]:
     """
     Best-effort host for per-league requests (e.g., 'www47.myfantasyleague.com').
@@ -68,25 +140,45 @@ def _league_host(lg: League) -> Optional[str]:
     return None
 
 
+_SESSION_COOKIE_KEY_PREFIXES = ("mfl_cookie::", "MFL_COOKIE::")
+_SESSION_COOKIE_KEYS = ("mfl_cookie", "MFL_COOKIE")
+_SESSION_COOKIE_DICT_KEYS = ("mfl_cookies", "MFL_COOKIES")
+
+
+def _user_host_cookies() -> Dict[str, str]:
+    """current_user.get_mfl_host_cookies(), decoded once per request (memoized on g)."""
+    cached = getattr(g, "_mfl_host_cookies_cache", None)
+    if cached is None:
+        try:
+            cached = current_user.get_mfl_host_cookies()
+        except Exception:
+            cached = {}
+        g._mfl_host_cookies_cache = cached
+    return cached
+
+
 def _cookie_for_host(host: Optional[str]) -> Optional[str]:
     """
-    Prefer per-host cookie; fall back to API cookie. Checks session and current_user storage.
+    Prefer per-host cookie; fall back to API cookie. Checks current_user and session storage.
     """
     if not host:
         host = "api.myfantasyleague.com"
 
+    # per-user cookie bundle (used by trades flow) -- the current/common path
+    v = _user_host_cookies().get(host)
+    if v:
+        return v
+
     # session keys (legacy)
-    keys = [
-        f"mfl_cookie::{host}",
-        f"MFL_COOKIE::{host}",
-        "mfl_cookie",
-        "MFL_COOKIE",
-    ]
-    for k in keys:
+    for prefix in _SESSION_COOKIE_KEY_PREFIXES:
+        v = session.get(prefix + host)
+        if v:
+            return v
+    for k in _SESSION_COOKIE_KEYS:
         v = session.get(k)
         if v:
             return v
-    for dict_key in ("mfl_cookies", "MFL_COOKIES"):
+    for dict_key in _SESSION_COOKIE_DICT_KEYS:
         d = session.get(dict_key)
         if isinstance(d, dict):
             if host in d and d[host]:
@@ -95,42 +187,69 @@ def _cookie_for_host(host: Optional[str]) -> Optional[str]:
             if base in d and d[base]:
                 return d[base]
 
-    # per-user cookie bundle (used by trades flow)
-    try:
-        host_cookies = current_user.get_mfl_host_cookies()
-        if host in host_cookies and host_cookies[host]:
-            return host_cookies[host]
-    except Exception:
-        pass
-
     # fallback
     return getattr(current_user, "mfl_cookie_api", None)
 
 
-def _team_names_map(league_id: int) -> Dict[str, str]:
-    """{franchise_id(str4): team_name} for a league."""
-    out: Dict[str, str] = {}
-    for t in Team.query.filter(Team.league_id == league_id).all():
-        if t.mfl_id:
-            out[str(t.mfl_id).zfill(4)] = t.name or str(t.mfl_id).zfill(4)
-    return out
+def _team_names_by_league(league_ids: List[int]) -> Dict[int, Dict[str, str]]:
+    """{league_pk: {franchise_id(str4): team_name}} for many leagues in one query."""
+    by_league: Dict[int, Dict[str, str]] = defaultdict(dict)
+    if not league_ids:
+        return by_league
+    rows = (
+        db.session.query(Team.league_id, Team.mfl_id, Team.name)
+        .filter(Team.league_id.in_(league_ids))
+        .all()
+    )
+    for league_id, mfl_id, name in rows:
+        if mfl_id:
+            fid = _pad4(mfl_id)
+            by_league[league_id][fid] = name or fid
+    return by_league
 
 
 def _player_lookup(player_ids: List[int]) -> Dict[str, Dict[str, Any]]:
     """Return {player_id(str): {name,pos,team}} for display."""
-    if not player_ids:
-        return {}
-    rows = Player.query.filter(Player.id.in_(player_ids)).all()
+    ids = sorted(set(player_ids))
     look: Dict[str, Dict[str, Any]] = {}
-    for p in rows:
-        look[str(p.id)] = {
-            "name": p.name,
-            "pos": getattr(p, "position", None) or getattr(p, "pos", None),
-            "team": getattr(p, "team", None),
-        }
+    # Column tuples only (no ORM instances); chunked to keep IN lists bounded
+    for i in range(0, len(ids), PLAYER_LOOKUP_CHUNK):
+        rows = (
+            db.session.query(Player.id, Player.name, Player.position, Player.team)
+            .filter(Player.id.in_(ids[i:i + PLAYER_LOOKUP_CHUNK]))
+        )
+        for pid, name, pos, team in rows:
+            look[str(pid)] = {"name": name, "pos": pos, "team": team}
     return look
 
 
+def _accumulate(
+    starters: List[Dict[str, Any]],
+    lg_name: Any,
+    lg_id: Any,
+    out: List[Dict[str, Any]],
+) -> tuple[int, int]:
+    """
+    Tag each starter with its league (in place; tiles are built fresh per
+    refresh), append it to `out`, and return (seconds_total, seconds_played).
+    Starters come from _norm_starter, so both second fields are already
+    non-negative ints (game_seconds never 0) and need no re-coercion.
+    """
+    secs_total = 0
+    secs_played = 0
+    for s in starters:
+        total = s["game_seconds"]
+        rem = s["seconds_remaining"]
+        secs_total += total
+        played = total - rem
+        if played > 0:
+            secs_played += played
+        s["league"] = lg_name
+        s["league_id"] = lg_id
+        out.append(s)
+    return secs_total, secs_played
+
+
 def _aggregate_from_tiles(tiles: List[Dict[str, Any]]) -> Dict[str, Any]:
     """
     Build the top 'Roster Showdown' totals + progress from all starters.
@@ -152,19 +271,13 @@ def _aggregate_from_tiles(tiles: List[Dict[str, Any]]) -> Dict[str, Any]:
         lg_name = t.get("league_name")
         lg_id = t.get("league_id")
 
-        for s in t.get("my_starters", []):
-            total = int(s.get("game_seconds", 3600) or 3600)
-            rem = int(s.get("seconds_remaining", 0) or 0)
-            my_secs_total += total
-            my_secs_played += max(0, total - rem)
-            starters_my.append({**s, "league": lg_name, "league_id": lg_id})
+        secs_total, secs_played = _accumulate(t.get("my_starters", []), lg_name, lg_id, starters_my)
+        my_secs_total += secs_total
+        my_secs_played += secs_played
 
-        for s in t.get("opp_starters", []):
-            total = int(s.get("game_seconds", 3600) or 3600)
-            rem = int(s.get("seconds_remaining", 0) or 0)
-            opp_secs_total += total
-            opp_secs_played += max(0, total - rem)
-            starters_opp.append({**s, "league": lg_name, "league_id": lg_id})
+        secs_total, secs_played = _accumulate(t.get("opp_starters", []), lg_name, lg_id, starters_opp)
+        opp_secs_total += secs_total
+        opp_secs_played += secs_played
 
     my_pct = int(round((my_secs_played / my_secs_total) * 100)) if my_secs_total > 0 else 0
     opp_pct = int(round((opp_secs_played / opp_secs_total) * 100)) if opp_secs_total > 0 else 0
@@ -226,46 +339,53 @@ def _normalize_side(side: Any) -> Dict[str, Any]:
     Computes starters' total/left seconds from normalized starters.
     """
     if isinstance(side, dict):
-        starters_raw = side.get("starters") or []
-        starters = [_norm_starter(s) for s in starters_raw]
-        total_secs = sum(int(s.get("game_seconds", 3600) or 0) for s in starters)
-        total_left = sum(int(s.get("seconds_remaining", 0) or 0) for s in starters)
-        return {
-            "franchise_id": side.get("franchise_id", side.get("fid")),
-            "name": side.get("name"),
-            "score": float(side.get("score") or 0.0),
-            "starters_seconds_total": int(total_secs),
-            "starters_seconds_left": int(total_left),
-            "starters": starters,
-        }
+        get = side.get
+    else:
+        def get(name: str, default: Any = None) -> Any:
+            return getattr(side, name, default)
+
+    # One pass: normalize each starter and total its (already int) seconds
+    starters: List[Dict[str, Any]] = []
+    total_secs = 0
+    total_left = 0
+    for raw in get("starters") or []:
+        ns = _norm_starter(raw)
+        starters.append(ns)
+        total_secs += ns["game_seconds"]
+        total_left += ns["seconds_remaining"]
 
-    starters_raw = getattr(side, "starters", None) or []
-    starters = [_norm_starter(s) for s in starters_raw]
-    total_secs = sum(int(s.get("game_seconds", 3600) or 0) for s in starters)
-    total_left = sum(int(s.get("seconds_remaining", 0) or 0) for s in starters)
     return {
-        "franchise_id": getattr(side, "franchise_id", getattr(side, "fid", None)),
-        "name": getattr(side, "name", None),
-        "score": float(getattr(side, "score", 0.0) or 0.0),
-        "starters_seconds_total": int(total_secs),
-        "starters_seconds_left": int(total_left),
+        "franchise_id": get("franchise_id", get("fid")),
+        "name": get("name"),
+        "score": float(get("score") or 0.0),
+        "starters_seconds_total": total_secs,
+        "starters_seconds_left": total_left,
         "starters": starters,
     }
 
 
-def _iter_sides_from_matchup(m: Any) -> List[Any]:
+_SIDE_ATTR_PAIRS = (
+    ("a", "b"),
+    ("home", "away"),
+    ("one", "two"),
+    ("left", "right"),
+    ("team1", "team2"),
+    ("side1", "side2"),
+    ("my", "opp"),
+)
+
+
+def _iter_sides_from_matchup(m: Any, reflect_fallback: bool = False, logger: Any = None) -> List[Any]:
     """
     Pull two sides from a LiveMatchup-like object, regardless of attribute names.
+    Our own parser's LiveMatchup is the common case and short-circuits to two
+    attribute reads. The dir() scan of last resort only runs when
+    reflect_fallback is set (LIVE_REFLECT_FALLBACK config).
     """
-    for a_name, b_name in [
-        ("a", "b"),
-        ("home", "away"),
-        ("one", "two"),
-        ("left", "right"),
-        ("team1", "team2"),
-        ("side1", "side2"),
-        ("my", "opp"),
-    ]:
+    if isinstance(m, LiveMatchup):
+        return [m.my, m.opp]
+
+    for a_name, b_name in _SIDE_ATTR_PAIRS:
         if hasattr(m, a_name) and hasattr(m, b_name):
             return [getattr(m, a_name), getattr(m, b_name)]
 
@@ -275,6 +395,11 @@ def _iter_sides_from_matchup(m: Any) -> List[Any]:
             if isinstance(val, (list, tuple)) and len(val) >= 2:
                 return list(val[:2])
 
+    if not reflect_fallback:
+        raise AttributeError("Could not extract matchup sides from parser result")
+    if logger is not None:
+        logger.warning("Live matchup sides found by reflection on %s", type(m).__name__)
+
     candidates = []
     for name in dir(m):
         if name.startswith("_"):
@@ -303,16 +428,17 @@ def live_index():
     if not current_user.is_authenticated:
         return redirect(url_for("auth.login"))
 
+    now = _now_ts()
     cache = _get_live_cache(current_user.id)
-    if not cache or (_now_ts() - float(cache.get("ts", 0))) > STALE_SECONDS:
+    if not cache or (now - cache.get("ts", 0)) > STALE_SECONDS:
         cache = _refresh_all_live()
         _set_live_cache(current_user.id, cache)
 
-    tiles = cache.get("tiles", []) if cache else []
-    agg = cache.get("aggregate", {}) if cache else {}
+    tiles = cache.get("tiles", [])
+    agg = cache.get("aggregate", {})
     player_lookup = cache.get("player_lookup", {})
     team_lookup = cache.get("team_lookup", {})
-    next_in = max(0, STALE_SECONDS - int(_now_ts() - float(cache.get("ts", 0)))) if cache else 0
+    next_in = max(0, STALE_SECONDS - int(now - cache.get("ts", now)))
 
     return render_template(
         "live/index.html",
@@ -320,7 +446,7 @@ def live_index():
         aggregate=agg,
         player_lookup=player_lookup,
         team_lookup=team_lookup,
-        fetched_at=datetime.fromtimestamp(cache.get("ts", _now_ts()), tz=timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC") if cache else None,
+        fetched_at=cache.get("fetched_at_str"),
         next_refresh_in=next_in,
         can_expand_aggregate=can_view_aggregate_detail(current_user),  # <-- added
     )
@@ -334,7 +460,7 @@ def refresh_live():
         return {"ok": False, "error": "auth"}, 401
 
     cache = _get_live_cache(current_user.id)
-    age = (_now_ts() - float(cache.get("ts", 0))) if cache else 1e9
+    age = (_now_ts() - cache.get("ts", 0)) if cache else 1e9
     if age < STALE_SECONDS:
         return {
             "ok": True,
@@ -353,6 +479,162 @@ def refresh_live():
     }
 
 
+def _empty_tile(info: Dict[str, Any], note: str = "None Available") -> Dict[str, Any]:
+    return {
+        "league_id": info["league_id"],
+        "league_name": info["league_name"],
+        "host": info["host"],
+        "week": None,
+        "note": note,
+        "my_team_name": None,
+        "opp_team_name": None,
+        "my_score": 0.0,
+        "opp_score": 0.0,
+        "my_progress_pct": 0,
+        "opp_progress_pct": 0,
+        "my_starters": [],
+        "opp_starters": [],
+    }
+
+
+def _fetch_one_league(info: Dict[str, Any], logger: Any) -> Dict[str, Any]:
+    """
+    Fetch + normalize one league's live matchup. Runs in a worker thread, so it
+    only reads the precomputed `info` dict (no DB, session or current_user).
+    Returns {"tile": tile_dict, "player_ids": set_of_ids}.
+    """
+    my_fid = info["my_fid"]
+    names_map = info["names_map"]
+
+    # If franchise id missing, we can't render a proper matchup
+    if not my_fid:
+        return {"tile": _empty_tile(info), "player_ids": set()}
+
+    try:
+        cache_key = (int(info["year"]), str(info["league_id"]))
+        entry = _get_league_live_entry(cache_key)
+        if entry is not None and (_now_ts() - entry[0]) <= STALE_SECONDS:
+            parsed = parse_live_scoring(entry[1], my_franchise_id=my_fid)
+        else:
+            # Revalidate a stale copy with If-Modified-Since; a 304 skips the body
+            last_modified = entry[2] if entry is not None else None
+            client = _get_client(info["year"], info["base_url"])
+            resp = client._export_response(
+                "liveScoring",
+                params={"L": info["league_id"]},
+                cookie=info["cookie"],
+                extra_headers={"If-Modified-Since": last_modified} if last_modified else None,
+            )
+            not_modified = resp.status_code == 304 and entry is not None
+            if not_modified:
+                xml = entry[1]
+            else:
+                xml = resp.content
+                last_modified = resp.headers.get("Last-Modified")
+            parsed = parse_live_scoring(xml, my_franchise_id=my_fid)
+            if parsed is not None:
+                _set_league_live_xml(cache_key, xml, last_modified)  # only payloads with my matchup
+            elif not_modified:
+                # Don't let 304s keep an error/empty body pinned; refetch in full next time
+                _drop_league_live_xml(cache_key)
+    except Exception as e:
+        logger.warning("Live scoring fetch failed for league %s: %s", info["league_id"], e)
+        return {"tile": _empty_tile(info), "player_ids": set()}
+
+    # ---- Normalize parser output to me/opp/week dicts ----
+    if isinstance(parsed, dict):
+        week = parsed.get("week")
+        me = _normalize_side(parsed.get("me") or {})
+        opp = _normalize_side(parsed.get("opp") or {})
+    elif isinstance(parsed, LiveMatchup):
+        week = getattr(parsed, "week", None)
+        try:
+            side_a, side_b = _iter_sides_from_matchup(
+                parsed, reflect_fallback=info["reflect_fallback"], logger=logger
+            )
+        except Exception as e:
+            logger.warning("Could not extract sides for league %s: %s", info["league_id"], e)
+            return {"tile": _empty_tile(info), "player_ids": set()}
+        # pick my side by franchise id
+        def _fid(x: Any) -> Optional[str]:
+            if isinstance(x, dict):
+                fid = x.get("franchise_id")
+            else:
+                fid = getattr(x, "franchise_id", None)
+            return _pad4(fid) if fid is not None else None
+        if _fid(side_a) == my_fid:
+            my_side, opp_side = side_a, side_b
+        elif _fid(side_b) == my_fid:
+            my_side, opp_side = side_b, side_a
+        else:
+            my_side, opp_side = side_a, side_b
+        me = _normalize_side(my_side)
+        opp = _normalize_side(opp_side)
+    else:
+        logger.warning("Unexpected live parser result type for league %s: %r", info["league_id"], type(parsed))
+        return {"tile": _empty_tile(info), "player_ids": set()}
+
+    # Names
+    my_name = me.get("name") or names_map.get(my_fid, my_fid)
+    if not my_name:
+        my_name = my_fid
+    opp_name = opp.get("name")
+    if not opp_name:
+        opp_id = opp.get("franchise_id")
+        if opp_id:
+            opp_fid = _pad4(opp_id)
+            opp_name = names_map.get(opp_fid, opp_fid)
+        else:
+            opp_name = None
+
+    # Scores
+    my_score = float(me.get("score") or 0.0)
+    opp_score = float(opp.get("score") or 0.0)
+
+    # Progress pct
+    my_total = int(me.get("starters_seconds_total") or 0)
+    my_left = int(me.get("starters_seconds_left") or 0)
+    opp_total = int(opp.get("starters_seconds_total") or 0)
+    opp_left = int(opp.get("starters_seconds_left") or 0)
+
+    my_played = max(0, my_total - my_left)
+    opp_played = max(0, opp_total - opp_left)
+
+    my_pct = int(round((my_played / my_total) * 100)) if my_total > 0 else 0
+    opp_pct = int(round((opp_played / opp_total) * 100)) if opp_total > 0 else 0
+
+    # Starters and collect player ids
+    my_starters = me.get("starters") or []
+    opp_starters = opp.get("starters") or []
+    pids: set[str] = set()
+    for s in my_starters:
+        pid = s.get("player_id")
+        if pid is not None:
+            pids.add(str(pid))
+    for s in opp_starters:
+        pid = s.get("player_id")
+        if pid is not None:
+            pids.add(str(pid))
+
+    tile = {
+        "league_id": info["league_id"],
+        "league_name": info["league_name"],
+        "host": info["host"],
+        "week": week,
+        "my_fid": my_fid,
+        "opp_fid": opp.get("franchise_id"),
+        "my_team_name": my_name,
+        "opp_team_name": opp_name,
+        "my_score": round(my_score, 1),
+        "opp_score": round(opp_score, 1),
+        "my_progress_pct": my_pct,
+        "opp_progress_pct": opp_pct,
+        "my_starters": my_starters,
+        "opp_starters": opp_starters,
+    }
+    return {"tile": tile, "player_ids": pids}
+
+
 def _refresh_all_live() -> Dict[str, Any]:
     year = datetime.now(timezone.utc).year
     leagues: List[League] = (
@@ -364,12 +646,13 @@ def _refresh_all_live() -> Dict[str, Any]:
     # ---- Precompute everything needed in worker threads (no DB inside threads) ----
     league_infos: List[Dict[str, Any]] = []
     team_lookup: Dict[str, Dict[str, str]] = {}
+    names_by_league = _team_names_by_league([lg.id for lg in leagues])  # one DB read on main thread
     for lg in leagues:
         host = _league_host(lg) or "api.myfantasyleague.com"
         base_url = f"https://{host}/{lg.year}/"
         cookie = _cookie_for_host(host)  # read from session/current_user on main thread
-        my_fid = str(lg.franchise_id).zfill(4) if lg.franchise_id else None
-        names_map = _team_names_map(lg.id)  # DB read on main thread
+        my_fid = _pad4(lg.franchise_id) if lg.franchise_id else None
+        names_map = names_by_league.get(lg.id, {})
         team_lookup[str(lg.mfl_id)] = names_map
 
         league_infos.append({
@@ -385,8 +668,10 @@ def _refresh_all_live() -> Dict[str, Any]:
 
     # Early out when no leagues
     if not league_infos:
+        ts = _now_ts()
         cache = {
-            "ts": _now_ts(),
+            "ts": ts,
+            "fetched_at_str": _fmt_fetched_at(ts),
             "tiles": [],
             "player_lookup": {},
             "team_lookup": {},
@@ -395,158 +680,50 @@ def _refresh_all_live() -> Dict[str, Any]:
         }
         return cache
 
+    # Bound logger/config for the workers (current_app is a context-local proxy)
     logger = current_app.logger
+    reflect_fallback = bool(current_app.config.get("LIVE_REFLECT_FALLBACK", False))
+    for info in league_infos:
+        info["reflect_fallback"] = reflect_fallback
+
+    # One job per host: leagues on the same MFL host are fetched one after
+    # another (MFL throttles per host), different hosts run in parallel.
+    # Outbound pacing is still enforced by the MFL client's shared rate limiter.
+    by_host: Dict[str, List[int]] = defaultdict(list)
+    for idx, info in enumerate(league_infos):
+        by_host[info["host"]].append(idx)
+
+    def fetch(info: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            return _fetch_one_league(info, logger)
+        except Exception as e:
+            logger.warning("Live worker crashed for league %s: %s", info["league_id"], e)
+            return {"tile": _empty_tile(info), "player_ids": set()}
 
-    # Concurrency: parallel across hosts, 1-at-a-time per host
-    host_locks: dict[str, Semaphore] = defaultdict(lambda: Semaphore(1))
-    unique_hosts = {info["host"] for info in league_infos}
-    max_workers = min(8, max(2, len(unique_hosts)))  # small pool; IO-bound
-
-    def build_empty_tile(info: Dict[str, Any], note: str = "None Available") -> Dict[str, Any]:
-        return {
-            "league_id": info["league_id"],
-            "league_name": info["league_name"],
-            "host": info["host"],
-            "week": None,
-            "note": note,
-            "my_team_name": None,
-            "opp_team_name": None,
-            "my_score": 0.0,
-            "opp_score": 0.0,
-            "my_progress_pct": 0,
-            "opp_progress_pct": 0,
-            "my_starters": [],
-            "opp_starters": [],
-        }
-
-    def worker(info: Dict[str, Any]) -> Dict[str, Any]:
-        # Returns {"tile": tile_dict, "player_ids": set_of_ids}
-        host = info["host"]
-        my_fid = info["my_fid"]
-        names_map = info["names_map"]
-
-        # If franchise id missing, we can't render a proper matchup
-        if not my_fid:
-            return {"tile": build_empty_tile(info), "player_ids": set()}
+    def worker(indexes: List[int]) -> List[tuple[int, Dict[str, Any]]]:
+        return [(i, fetch(league_infos[i])) for i in indexes]
 
-        # Serialize per-host calls
-        with host_locks[host]:
-            try:
-                client = MFLClient(year=info["year"], base_url=info["base_url"])
-                xml = client._export("liveScoring", params={"L": info["league_id"]}, cookie=info["cookie"])
-                parsed = parse_live_scoring(xml, my_franchise_id=my_fid)
-            except Exception as e:
-                logger.warning("Live scoring fetch failed for league %s: %s", info["league_id"], e)
-                return {"tile": build_empty_tile(info), "player_ids": set()}
-
-        # ---- Normalize parser output to me/opp/week dicts ----
-        if isinstance(parsed, dict):
-            week = parsed.get("week")
-            me = _normalize_side(parsed.get("me") or {})
-            opp = _normalize_side(parsed.get("opp") or {})
-        elif isinstance(parsed, LiveMatchup):
-            week = getattr(parsed, "week", None)
-            try:
-                side_a, side_b = _iter_sides_from_matchup(parsed)
-            except Exception as e:
-                logger.warning("Could not extract sides for league %s: %s", info["league_id"], e)
-                return {"tile": build_empty_tile(info), "player_ids": set()}
-            # pick my side by franchise id
-            def _fid(x: Any) -> Optional[str]:
-                if isinstance(x, dict):
-                    fid = x.get("franchise_id")
-                else:
-                    fid = getattr(x, "franchise_id", None)
-                return str(fid).zfill(4) if fid is not None else None
-            if _fid(side_a) == my_fid:
-                my_side, opp_side = side_a, side_b
-            elif _fid(side_b) == my_fid:
-                my_side, opp_side = side_b, side_a
-            else:
-                my_side, opp_side = side_a, side_b
-            me = _normalize_side(my_side)
-            opp = _normalize_side(opp_side)
-        else:
-            logger.warning("Unexpected live parser result type for league %s: %r", info["league_id"], type(parsed))
-            return {"tile": build_empty_tile(info), "player_ids": set()}
-
-        # Names
-        my_name = me.get("name") or names_map.get(my_fid, my_fid)
-        if not my_name:
-            my_name = my_fid
-        opp_name = opp.get("name")
-        if not opp_name:
-            opp_id = opp.get("franchise_id")
-            opp_name = names_map.get(str(opp_id).zfill(4), str(opp_id).zfill(4)) if opp_id else None
-
-        # Scores
-        my_score = float(me.get("score") or 0.0)
-        opp_score = float(opp.get("score") or 0.0)
-
-        # Progress pct
-        my_total = int(me.get("starters_seconds_total") or 0)
-        my_left = int(me.get("starters_seconds_left") or 0)
-        opp_total = int(opp.get("starters_seconds_total") or 0)
-        opp_left = int(opp.get("starters_seconds_left") or 0)
-
-        my_played = max(0, my_total - my_left)
-        opp_played = max(0, opp_total - opp_left)
-
-        my_pct = int(round((my_played / my_total) * 100)) if my_total > 0 else 0
-        opp_pct = int(round((opp_played / opp_total) * 100)) if opp_total > 0 else 0
-
-        # Starters and collect player ids
-        my_starters = me.get("starters") or []
-        opp_starters = opp.get("starters") or []
-        pids: set[str] = set()
-        for s in my_starters:
-            pid = s.get("player_id")
-            if pid is not None:
-                pids.add(str(pid))
-        for s in opp_starters:
-            pid = s.get("player_id")
-            if pid is not None:
-                pids.add(str(pid))
-
-        tile = {
-            "league_id": info["league_id"],
-            "league_name": info["league_name"],
-            "host": info["host"],
-            "week": week,
-            "my_fid": my_fid,
-            "opp_fid": opp.get("franchise_id"),
-            "my_team_name": my_name,
-            "opp_team_name": opp_name,
-            "my_score": round(my_score, 1),
-            "opp_score": round(opp_score, 1),
-            "my_progress_pct": my_pct,
-            "opp_progress_pct": opp_pct,
-            "my_starters": my_starters,
-            "opp_starters": opp_starters,
-        }
-        return {"tile": tile, "player_ids": pids}
+    results: List[Optional[Dict[str, Any]]] = [None] * len(league_infos)
+    with ThreadPoolExecutor(max_workers=min(MFL_MAX_WORKERS, len(by_host))) as ex:
+        for batch in ex.map(worker, by_host.values()):
+            for i, res in batch:
+                results[i] = res
 
-    # Run workers
+    # Merge on the main thread, in league order
     tiles: List[Dict[str, Any]] = []
     all_player_ids: set[str] = set()
-
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        futures = [ex.submit(worker, info) for info in league_infos]
-        for fut in as_completed(futures):
-            try:
-                res = fut.result()
-            except Exception as e:
-                logger.warning("Live worker crashed: %s", e)
-                continue
-            tiles.append(res.get("tile") or {})
-            all_player_ids.update(res.get("player_ids") or set())
+    for res in results:
+        tiles.append(res["tile"])
+        all_player_ids.update(res["player_ids"])
 
     # Player lookup after all results (DB on main thread)
     lookup = _player_lookup([int(x) for x in all_player_ids]) if all_player_ids else {}
     aggregate = _aggregate_from_tiles(tiles)
 
+    ts = _now_ts()
     cache = {
-        "ts": _now_ts(),
+        "ts": ts,
+        "fetched_at_str": _fmt_fetched_at(ts),
         "tiles": tiles,
         "player_lookup": lookup,
         "team_lookup": team_lookup,
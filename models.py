@@ -1,4 +1,5 @@
 # models.py
+from flask import current_app
 from flask_login import UserMixin
 from app import db, bcrypt  # created in app.py
 from datetime import datetime
@@ -105,10 +106,25 @@ class User(UserMixin, db.Model):
             return False
         return bcrypt.check_password_hash(self.password_hash, password)
 
+    def password_needs_rehash(self) -> bool:
+        """
+        True when the stored bcrypt hash uses a different cost than the configured
+        BCRYPT_LOG_ROUNDS (hash format: $2b$<cost>$...).
+        """
+        parts = (self.password_hash or "").split("$")
+        if len(parts) < 4 or not parts[2].isdigit():
+            return False
+        return int(parts[2]) != int(current_app.config.get("BCRYPT_LOG_ROUNDS", 12))
+
     def __repr__(self) -> str:
         return f"<User {self.id} {self.username}>"
 
 
+# Stripe webhooks resolve users by customer id; one customer maps to one user
+# (NULLs don't collide, so users without a customer id are unaffected)
+db.Index("ix_users_stripe_customer_id", User.stripe_customer_id, unique=True)
+
+
 # ----- League ---------------------------------------------------------------
 
 class League(db.Model):
@@ -185,6 +201,10 @@ class League(db.Model):
         return f"<League {self.id} {self.name} {self.year} u{self.user_id} mfl:{self.mfl_id}>"
 
 
+# Per-user league lists are ordered newest season first, then by name
+db.Index("ix_leagues_user_year_name", League.user_id, League.year.desc(), League.name)
+
+
 # ----- Team -----------------------------------------------------------------
 
 class Team(db.Model):
@@ -324,3 +344,16 @@ class NflSchedule(db.Model):
     def __repr__(self) -> str:
         h = "H" if self.is_home else "A"
         return f"<NflSchedule {self.year} W{self.week} {self.team} vs {self.opponent} {h}>"
+
+
+# ----- Stripe event dedupe ---------------------------------------------------
+
+class StripeEvent(db.Model):
+    __tablename__ = "stripe_events"
+
+    # Stripe event id (evt_...); a retried delivery collides on the PK
+    id = db.Column(db.String(255), primary_key=True)
+    received_at = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+
+    def __repr__(self) -> str:
+        return f"<StripeEvent {self.id}>"
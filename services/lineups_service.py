@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import logging
+import threading
+from functools import lru_cache
+import time
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from urllib.parse import quote_plus
 
 import requests
 
 from app import db
 from models import League, Team, Roster, Player
+from services.mfl_http import iter_xml
 
 log = logging.getLogger(__name__)
 
@@ -57,16 +61,53 @@ def _encode_params_with_commas(params: dict) -> str:
 
 # ----------------------- DB-backed roster gather ----------------------------
 
-def get_my_team_player_ids(league_id_pk: int) -> List[int]:
+# (kind, league_id, franchise_id, synced_at) -> (stored_at, rows)
+# Rosters are only rewritten by a league sync, which also bumps synced_at, so
+# a new sync naturally misses the old entries; the TTL just bounds staleness
+# of Player name/position edits and keeps the dict from growing forever.
+ROSTER_CACHE_TTL_SECONDS = 60 * 60
+ROSTER_CACHE_MAX_ENTRIES = 2048
+_ROSTER_CACHE: Dict[Tuple[Any, ...], Tuple[float, tuple]] = {}
+_ROSTER_CACHE_LOCK = threading.Lock()
+
+
+def _cached_roster_rows(kind: str, league: Any, load: Callable[[Any], list]) -> list:
+    key = (kind, league.id, league.franchise_id, league.synced_at)
+    now = time.time()
+    with _ROSTER_CACHE_LOCK:
+        hit = _ROSTER_CACHE.get(key)
+    if hit and now - hit[0] < ROSTER_CACHE_TTL_SECONDS:
+        return list(hit[1])
+
+    rows = load(league)
+    with _ROSTER_CACHE_LOCK:
+        if len(_ROSTER_CACHE) >= ROSTER_CACHE_MAX_ENTRIES:
+            # drop expired entries first, then the oldest inserted
+            for k in [k for k, (ts, _) in _ROSTER_CACHE.items() if now - ts >= ROSTER_CACHE_TTL_SECONDS]:
+                del _ROSTER_CACHE[k]
+            while len(_ROSTER_CACHE) >= ROSTER_CACHE_MAX_ENTRIES:
+                del _ROSTER_CACHE[next(iter(_ROSTER_CACHE))]
+        _ROSTER_CACHE[key] = (now, tuple(rows))
+    return rows
+
+
+def get_my_team_player_ids(league_id_pk: int, *, league: Any = None) -> List[int]:
     """
     Return ALL rostered player IDs (ints) for the user's franchise
     in the given League (by DB primary key), using Team.mfl_id == League.franchise_id.
     Includes any Taxi/IR because status isn't stored (as requested).
+    Cached per league sync (see _cached_roster_rows). Callers that already hold
+    the league's id/franchise_id/synced_at (ORM or plain row) can pass it as
+    `league` to skip the League lookup.
     """
-    league: League | None = db.session.get(League, league_id_pk)
+    if league is None:
+        league = db.session.get(League, league_id_pk)
     if not league:
         return []
+    return _cached_roster_rows("ids", league, _load_my_team_player_ids)
 
+
+def _load_my_team_player_ids(league: Any) -> List[int]:
     team: Team | None = (
         db.session.query(Team)
         .filter(Team.league_id == league.id, Team.mfl_id == league.franchise_id)
@@ -97,6 +138,7 @@ def fetch_projected_scores(
     *,
     cookie: Optional[str] = None,
     timeout: int = 20,
+    session: Optional[requests.Session] = None,
 ) -> Dict[int, Projection]:
     base = _base_url(str(host), year)
     players_param = _players_csv(player_ids)
@@ -119,37 +161,39 @@ def fetch_projected_scores(
 
     log.debug("MFL projectedScores GET %s", url)
 
-    resp = requests.get(url, headers=headers, timeout=timeout)
-    resp.raise_for_status()
-
+    http = session or requests
     out: Dict[int, Projection] = {}
-    try:
-        root = ET.fromstring(resp.content)
-    except ET.ParseError:
-        root = ET.Element("projectedScores")
-
-    for ps in root.findall(".//playerScore"):
-        pid = ps.get("id")
-        raw = ps.get("score")
-        if not pid:
-            continue
+    # Stream-parse the body instead of buffering it and building a full tree;
+    # each <playerScore> goes straight into `out` and is then dropped.
+    with http.get(url, headers=headers, timeout=timeout, stream=True) as resp:
+        resp.raise_for_status()
+        resp.raw.decode_content = True
         try:
-            pid_i = int(pid)
-        except Exception:
-            try:
-                pid_i = int((pid or "").lstrip("0") or "0")
-            except Exception:
-                continue
-
-        if raw is None or str(raw).strip() == "":
-            projected: Optional[float] = None
-        else:
-            try:
-                projected = float(raw)
-            except Exception:
-                projected = None
-
-        out[pid_i] = Projection(player_id=pid_i, projected=projected)
+            for ps in iter_xml(resp.raw, "playerScore", strict=True):
+                pid = ps.get("id")
+                raw = ps.get("score")
+                if not pid:
+                    continue
+                try:
+                    pid_i = int(pid)
+                except Exception:
+                    try:
+                        pid_i = int((pid or "").lstrip("0") or "0")
+                    except Exception:
+                        continue
+
+                if raw is None or str(raw).strip() == "":
+                    projected: Optional[float] = None
+                else:
+                    try:
+                        projected = float(raw)
+                    except Exception:
+                        projected = None
+
+                out[pid_i] = Projection(player_id=pid_i, projected=projected)
+        except ET.ParseError:
+            # Unparseable body: no projections at all, as before (not a partial set)
+            out.clear()
 
     # Backfill requested ids not present in response
     for any_id in player_ids:
@@ -174,11 +218,13 @@ def submit_lineup(
     *,
     cookie: Optional[str] = None,
     timeout: int = 20,
+    session: Optional[requests.Session] = None,
 ) -> Tuple[bool, str]:
     """
     GET https://{host}/{year}/import?TYPE=lineup&L={L}&W={W}&STARTERS=pid1,pid2,...
     SUCCESS only if the body contains XML <status>OK</status>.
     We DO NOT pass FRANCHISE_ID (session auth).
+    Pass a shared requests.Session as `session` to reuse kept-alive connections.
     """
     base = _base_url(str(host), year)
     url = f"{base}/import"
@@ -193,7 +239,8 @@ def submit_lineup(
     if cookie:
         headers["Cookie"] = cookie
 
-    resp = requests.get(url, params=params, headers=headers, timeout=timeout)
+    http = session or requests
+    resp = http.get(url, params=params, headers=headers, timeout=timeout)
 
     text = ""
     try:
@@ -285,11 +332,19 @@ def group_and_sort_players_for_review(
 
 # ------------------------ Helpers for blueprint use --------------------------
 
-def build_players_for_review(league_id_pk: int) -> List[Tuple[int, str, str, str]]:
-    league: League | None = db.session.get(League, league_id_pk)
+def build_players_for_review(league_id_pk: int, *, league: Any = None) -> List[Tuple[int, str, str, str]]:
+    """
+    (pid, name, POS, NFL) for my roster in the league; cached per league sync.
+    `league` works as in get_my_team_player_ids.
+    """
+    if league is None:
+        league = db.session.get(League, league_id_pk)
     if not league:
         return []
+    return _cached_roster_rows("review", league, _load_players_for_review)
 
+
+def _load_players_for_review(league: Any) -> List[Tuple[int, str, str, str]]:
     team: Team | None = (
         db.session.query(Team)
         .filter(Team.league_id == league.id, Team.mfl_id == league.franchise_id)
@@ -324,8 +379,15 @@ def parse_lineup_requirements(starters_label: str | None) -> Tuple[Optional[int]
     """
     if not starters_label:
         return None, {}
+    # Labels repeat across requests; the parse is cached and each caller
+    # gets its own dict so nothing can mutate the cached value
+    total, items = _parse_lineup_requirements(str(starters_label))
+    return total, dict(items)
+
 
-    s = str(starters_label).strip()
+@lru_cache(maxsize=1024)
+def _parse_lineup_requirements(starters_label: str) -> Tuple[Optional[int], Tuple[Tuple[str, Tuple[int, int]], ...]]:
+    s = starters_label.strip()
     total: Optional[int] = None
     ranges: Dict[str, Tuple[int, int]] = {}
 
@@ -363,7 +425,7 @@ def parse_lineup_requirements(starters_label: str | None) -> Tuple[Optional[int]
                 continue
         ranges[pos] = (max(0, lo), max(0, hi if hi >= lo else lo))
 
-    return total, ranges
+    return total, tuple(ranges.items())
 
 
 def pick_optimal_lineup(
@@ -13,6 +13,8 @@ from urllib.parse import unquote_plus
 import requests
 from flask import current_app
 
+from services.mfl_http import make_mfl_session
+
 DEFAULT_TIMEOUT = 20  # seconds
 RATE_MAX_CALLS = 60
 RATE_WINDOW_SEC = 60
@@ -61,6 +63,13 @@ class RateLimiter:
 _rl = RateLimiter()
 
 
+# ----------------------------- HTTP Session ----------------------------------
+
+# Keep-alive session shared by every MFLClient. No adapter-level retries:
+# _export_response runs its own backoff loop over RETRY_STATUSES.
+_http = make_mfl_session(retries=0)
+
+
 # ----------------------------- Logging Helpers -------------------------------
 
 def _iso_utc(ts: datetime | None) -> str | None:
@@ -147,6 +156,7 @@ class MFLClient:
         self.base = base_url or f"https://api.myfantasyleague.com/{year}/"
         self.timeout = timeout
         self.default_params = {"XML": "1"}
+        self.session = _http
 
     # ---------------------------- Public API ---------------------------------
 
@@ -166,13 +176,16 @@ class MFLClient:
                 url = f"{self.base}{path}"
                 params = {"USERNAME": username, "PASSWORD": password, "XML": "1"}
 
+                # Pooled session too: its jar rejects every Set-Cookie, but
+                # resp.cookies is built per response, so _extract_cookie still
+                # sees the login cookie and nothing is kept for other users.
                 if method == "POST":
                     _log_login_attempt(method, url)
-                    resp = requests.post(url, data=params, timeout=self.timeout, headers=DEFAULT_HEADERS)
+                    resp = self.session.post(url, data=params, timeout=self.timeout, headers=DEFAULT_HEADERS)
                 else:
                     # Avoid logging query string with credentials
                     _log_login_attempt(method, url)
-                    resp = requests.get(url, params=params, timeout=self.timeout, headers=DEFAULT_HEADERS)
+                    resp = self.session.get(url, params=params, timeout=self.timeout, headers=DEFAULT_HEADERS)
 
                 _log_login_attempt(method, url, status=resp.status_code)
 
@@ -295,6 +308,26 @@ class MFLClient:
         """
         Core GET wrapper with retry, logging, and cross-subdomain auth helpers.
         """
+        return self._export_response(
+            type_, params, cookie, retries, backoff_base, context=context
+        ).content
+
+    def _export_response(
+        self,
+        type_: str,
+        params: Optional[Dict[str, Any]] = None,
+        cookie: Optional[str] = None,
+        retries: int = 3,
+        backoff_base: float = 0.75,
+        *,
+        context: Optional[Dict[str, Any]] = None,
+        extra_headers: Optional[Dict[str, str]] = None,
+    ) -> requests.Response:
+        """
+        _export, but returns the Response itself, for callers that need its
+        headers or status (e.g. a conditional GET answered with 304 Not Modified,
+        which is passed through, not raised).
+        """
         _rl.wait()
         url = f"{self.base}export"
         merged_params: Dict[str, Any] = {"TYPE": type_, **self.default_params, **(params or {})}
@@ -314,14 +347,14 @@ class MFLClient:
             # no app context; ignore
             pass
 
-        headers = {**DEFAULT_HEADERS, **self._cookie_header(cookie)}
+        headers = {**DEFAULT_HEADERS, **self._cookie_header(cookie), **(extra_headers or {})}
 
         attempt = 0
         while True:
             attempt += 1
             start = time.time()
             started_at = datetime.now(timezone.utc)
-            resp = requests.get(url, params=merged_params, headers=headers, timeout=self.timeout)
+            resp = self.session.get(url, params=merged_params, headers=headers, timeout=self.timeout)
             elapsed_ms = int((time.time() - start) * 1000)
 
             # Retry on transient statuses
@@ -359,7 +392,7 @@ class MFLClient:
             )
             self._raise_for_status(resp)
 
-            return resp.content
+            return resp
 
     # ---------------------------- Helpers ------------------------------------
 
@@ -0,0 +1,98 @@
+# services/mfl_http.py
+"""
+Shared plumbing for outbound MFL traffic.
+
+Every blueprint that talks to MFL (lineups, injuries, live via MFLClient)
+builds its session and draws its concurrency from here, so the whole app
+agrees on pooling, retries, cookie handling and how hard it leans on MFL's
+hosts.
+"""
+from __future__ import annotations
+
+import xml.etree.ElementTree as ET
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import HTTPError as Urllib3HTTPError
+from urllib3.util.retry import Retry
+
+# Default cap on concurrent MFL calls per fan-out. MFL throttles aggressive
+# clients, so stay low; override with the LINEUPS_MAX_WORKERS config key.
+MFL_MAX_WORKERS = 3
+
+
+def make_mfl_session(
+    *, retries: int = 2, pool_connections: int = 50, pool_maxsize: int = 16
+) -> requests.Session:
+    """
+    Keep-alive session for MFL exports, meant to be built once per module and
+    shared across threads: repeat calls to the same league host skip DNS + TLS.
+
+    - Cookies are per-user and always sent as an explicit header, so the jar
+      rejects every Set-Cookie; a shared jar must never replay one user's
+      session for someone else.
+    - Accept-Encoding is pinned to what urllib3 decodes itself (zlib, in C),
+      whatever optional codecs happen to be installed.
+    - Transient gateway errors (502/503/504) on GETs are retried `retries`
+      times with a short backoff; pass 0 when the caller has its own loop.
+    """
+    s = requests.Session()
+    s.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    s.headers["Accept-Encoding"] = "gzip, deflate"
+    max_retries = 0
+    if retries:
+        max_retries = Retry(
+            total=retries,
+            backoff_factor=0.2,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,  # one pool per league host (www43..., api...)
+        pool_maxsize=pool_maxsize,
+        max_retries=max_retries,
+    )
+    s.mount("https://", adapter)
+    s.mount("http://", adapter)
+    return s
+
+
+def iter_xml(
+    source: Any,
+    tag: str,
+    root_attrib: Optional[dict[str, str]] = None,
+    *,
+    strict: bool = False,
+) -> Iterator[ET.Element]:
+    """
+    Stream-parse an MFL XML export (typically a streamed ``resp.raw`` with
+    ``decode_content = True``), yielding each complete top-level <tag>.
+
+    Handled elements are dropped from the root as we go, so the full DOM is
+    never built; read what you need from an element before asking for the
+    next one. The root's attributes are copied into ``root_attrib``.
+    Unparseable input simply ends the stream, unless ``strict`` is set, in
+    which case the ET.ParseError propagates so the caller can discard a
+    partial result. A socket error mid-body is re-raised as a requests
+    exception, as if it happened during the GET.
+    """
+    root: Optional[ET.Element] = None
+    try:
+        for event, elem in ET.iterparse(source, events=("start", "end")):
+            if root is None:
+                root = elem
+                if root_attrib is not None:
+                    root_attrib.update(elem.attrib)
+                continue
+            if event == "end" and elem.tag == tag:
+                yield elem
+                root.clear()
+    except ET.ParseError:
+        if strict:
+            raise
+        return
+    except Urllib3HTTPError as e:
+        raise requests.ConnectionError(e) from e
@@ -1,6 +1,7 @@
 # services/mfl_live.py
 from __future__ import annotations
 
+import io
 import math
 import xml.etree.ElementTree as ET
 from dataclasses import dataclass
@@ -79,26 +80,36 @@ def parse_live_scoring(xml_bytes: bytes, my_franchise_id: str) -> Optional[LiveM
     return the matchup that includes the user's franchise with only STARTERS kept.
 
     Returns None if the user's matchup is not found.
+
+    Streams the payload with iterparse: each <matchup> is examined as soon as
+    it closes, then cleared, and parsing stops at the user's matchup instead
+    of building the whole league's tree first.
     """
     if not xml_bytes:
         return None
 
     my_fid = str(my_franchise_id or "").zfill(4)
-    root = ET.fromstring(xml_bytes)
-
-    # week attribute is on <liveScoring week="1">
+    root = None
     week = None
-    try:
-        w = root.get("week")
-        if w is not None:
-            week = int(w)
-    except Exception:
-        week = None
 
-    for mu in root.findall(".//matchup"):
+    for event, elem in ET.iterparse(io.BytesIO(xml_bytes), events=("start", "end")):
+        if root is None:
+            # first event is the document element: <liveScoring week="1">
+            root = elem
+            try:
+                w = root.get("week")
+                if w is not None:
+                    week = int(w)
+            except Exception:
+                week = None
+        if event != "end" or elem.tag != "matchup":
+            continue
+
+        mu = elem
         frs = mu.findall("./franchise")
         if not frs or len(frs) < 2:
             # some leagues include double-headers; we still expect 2-node franchise blocks here
+            mu.clear()
             continue
 
         # Find side that is "me"
@@ -108,7 +119,8 @@ def parse_live_scoring(xml_bytes: bytes, my_franchise_id: str) -> Optional[LiveM
                 idx_me = i
                 break
         if idx_me is None:
-            continue  # not my matchup
+            mu.clear()  # not my matchup; free its players
+            continue
 
         f_me = frs[idx_me]
         f_opp = frs[1 - idx_me] if len(frs) >= 2 else None
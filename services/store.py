@@ -1,7 +1,7 @@
 # services/store.py
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
 from typing import Optional
 from sqlalchemy import text
 from app import db
@@ -99,3 +99,44 @@ def mark_weekly_free_used(user_id: int, week_monday: date) -> None:
         {"uid": user_id, "wk": _dstr(week_monday)},
     )
     db.session.commit()
+
+
+# -----------------------------------------------------------------------------
+# Account page bundle: every per-user counter in one round-trip
+# -----------------------------------------------------------------------------
+
+def get_account_bundle(user_id: int, d: Optional[date] = None, week_monday: Optional[date] = None) -> dict:
+    """
+    Fetch the counters shown on /account with a single statement:
+    today's paid mass-offer count, bonus balance, weekly-free flag and league count.
+    """
+    d = d or date.today()
+    week_monday = week_monday or (d - timedelta(days=d.weekday()))
+    row = db.session.execute(
+        text("""
+            SELECT COALESCE(u.bonus_mass_offers, 0) AS bonus_balance,
+                   (SELECT c.count
+                      FROM mass_offer_daily_counters c
+                     WHERE c.user_id = u.id AND c.on_date = :d
+                     LIMIT 1) AS today_count,
+                   (SELECT w.used
+                      FROM weekly_free_mass_offers w
+                     WHERE w.user_id = u.id AND w.week_monday = :wk
+                     LIMIT 1) AS weekly_free_used,
+                   (SELECT COUNT(*)
+                      FROM leagues l
+                     WHERE l.user_id = u.id) AS leagues_count
+              FROM users u
+             WHERE u.id = :uid
+             LIMIT 1
+        """),
+        {"uid": user_id, "d": _dstr(d), "wk": _dstr(week_monday)},
+    ).mappings().fetchone()
+    if not row:
+        return {"today_count": 0, "bonus_balance": 0, "weekly_free_used": False, "leagues_count": 0}
+    return {
+        "today_count": int(row["today_count"] or 0),
+        "bonus_balance": int(row["bonus_balance"] or 0),
+        "weekly_free_used": bool(row["weekly_free_used"] and int(row["weekly_free_used"]) == 1),
+        "leagues_count": int(row["leagues_count"] or 0),
+    }
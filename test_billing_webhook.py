@@ -0,0 +1,75 @@
+import io
+import unittest
+
+from flask import Flask
+from werkzeug.test import EnvironBuilder
+
+from billing.routes import _WEBHOOK_MAX_BYTES, _read_capped, billing_bp
+
+SIG = "t=1,v1=" + "ab" * 32
+
+
+class _Trickle(io.RawIOBase):
+    """Stream that hands out at most `step` bytes per read(), like a socket."""
+
+    def __init__(self, data: bytes, step: int = 1000):
+        self._buf = io.BytesIO(data)
+        self._step = step
+
+    def readable(self):
+        return True
+
+    def read(self, n=-1):
+        if n is None or n < 0:
+            n = self._step
+        return self._buf.read(min(n, self._step))
+
+
+class ReadCappedTests(unittest.TestCase):
+    def test_short_reads_are_retried_until_eof(self):
+        self.assertEqual(_read_capped(_Trickle(b"x" * 2500), 10_000), b"x" * 2500)
+
+    def test_stops_at_limit(self):
+        self.assertEqual(len(_read_capped(_Trickle(b"x" * 5000), 1234)), 1234)
+
+
+class WebhookBodyCapTests(unittest.TestCase):
+    def setUp(self):
+        app = Flask(__name__)
+        app.config["STRIPE_WEBHOOK_SECRET"] = "whsec_test"
+        app.config["STRIPE_SECRET_KEY"] = "sk_test_x"
+        app.register_blueprint(billing_bp)
+        self.app = app
+
+    def _post_chunked(self, body: bytes):
+        # No Content-Length: the body arrives as a terminated (chunked) stream
+        builder = EnvironBuilder(
+            path="/billing/webhook", method="POST",
+            headers={"Stripe-Signature": SIG, "Content-Type": "application/json"},
+        )
+        environ = builder.get_environ()
+        environ.pop("CONTENT_LENGTH", None)
+        environ["wsgi.input"] = io.BytesIO(body)
+        environ["wsgi.input_terminated"] = True
+        with self.app.request_context(environ):
+            return self.app.full_dispatch_request()
+
+    def test_oversized_content_length_is_rejected(self):
+        r = self.app.test_client().post(
+            "/billing/webhook", data=b"x" * (_WEBHOOK_MAX_BYTES + 1),
+            headers={"Stripe-Signature": SIG},
+        )
+        self.assertEqual(r.status_code, 413)
+
+    def test_oversized_chunked_body_is_rejected(self):
+        r = self._post_chunked(b"x" * (_WEBHOOK_MAX_BYTES + 1))
+        self.assertEqual(r.status_code, 413)
+
+    def test_chunked_body_at_cap_reaches_signature_check(self):
+        # Not JSON / not signed, so construct_event rejects it: 400, not 413
+        r = self._post_chunked(b"x" * _WEBHOOK_MAX_BYTES)
+        self.assertEqual(r.status_code, 400)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,82 @@
+import logging
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from live import routes as live
+
+MINE = (
+    b'<liveScoring week="5"><matchup>'
+    b'<franchise id="0006" score="10"><players/></franchise>'
+    b'<franchise id="0002" score="8"><players/></franchise>'
+    b'</matchup></liveScoring>'
+)
+NOT_MINE = b'<liveScoring week="5"/>'
+KEY = (2025, "100")
+LOG = logging.getLogger(__name__)
+LOG.addHandler(logging.NullHandler())  # expected warnings stay quiet
+
+
+class _Client:
+    """Stand-in MFLClient: returns queued (status, body) pairs, records headers."""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.sent_headers = []
+
+    def _export_response(self, type_, params=None, cookie=None, extra_headers=None, **kw):
+        self.sent_headers.append(extra_headers)
+        status, body = self.responses.pop(0)
+        return SimpleNamespace(
+            status_code=status, content=body,
+            headers={"Last-Modified": "Sun, 05 Oct 2025 17:00:00 GMT"} if status == 200 else {},
+        )
+
+
+def _info():
+    return {
+        "league_id": "100", "league_name": "L100", "year": 2025, "host": "h",
+        "base_url": "https://h/2025/", "cookie": None, "my_fid": "0006",
+        "names_map": {}, "reflect_fallback": False,
+    }
+
+
+class LeagueLiveCacheTests(unittest.TestCase):
+    def setUp(self):
+        live._LEAGUE_CACHE_STORE.clear()
+
+    def tearDown(self):
+        live._LEAGUE_CACHE_STORE.clear()
+
+    def _fetch(self, client):
+        with mock.patch.object(live, "_get_client", return_value=client):
+            return live._fetch_one_league(_info(), LOG)
+
+    def test_matchup_payload_is_cached(self):
+        res = self._fetch(_Client((200, MINE)))
+        self.assertEqual(res["tile"]["my_score"], 10.0)
+        self.assertEqual(live._get_league_live_entry(KEY)[1], MINE)
+
+    def test_none_parse_is_not_cached(self):
+        self._fetch(_Client((200, NOT_MINE)))
+        self.assertIsNone(live._get_league_live_entry(KEY))
+
+    def test_304_that_parses_to_none_drops_the_entry(self):
+        # A stale entry whose body no longer holds my matchup, revalidated by a 304
+        live._set_league_live_xml(KEY, NOT_MINE, "Sun, 05 Oct 2025 16:00:00 GMT")
+        with mock.patch.object(live, "_now_ts", return_value=live._now_ts() + live.STALE_SECONDS + 1):
+            client = _Client((304, b""))
+            self._fetch(client)
+        self.assertEqual(client.sent_headers, [{"If-Modified-Since": "Sun, 05 Oct 2025 16:00:00 GMT"}])
+        self.assertIsNone(live._get_league_live_entry(KEY))
+
+    def test_304_with_matchup_keeps_the_entry(self):
+        live._set_league_live_xml(KEY, MINE, "Sun, 05 Oct 2025 16:00:00 GMT")
+        with mock.patch.object(live, "_now_ts", return_value=live._now_ts() + live.STALE_SECONDS + 1):
+            res = self._fetch(_Client((304, b"")))
+        self.assertEqual(res["tile"]["my_score"], 10.0)
+        self.assertEqual(live._get_league_live_entry(KEY)[1], MINE)
+
+
+if __name__ == "__main__":
+    unittest.main()
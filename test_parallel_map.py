@@ -0,0 +1,64 @@
+import threading
+import time
+import unittest
+
+from flask import Flask
+
+from lineups import routes as lineups
+
+
+class _InFlight:
+    """Callable that records the peak number of concurrent calls."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.now = 0
+        self.peak = 0
+
+    def __call__(self, x):
+        with self.lock:
+            self.now += 1
+            self.peak = max(self.peak, self.now)
+        time.sleep(0.01)
+        with self.lock:
+            self.now -= 1
+        return x * 2
+
+
+class ParallelMapTests(unittest.TestCase):
+    def setUp(self):
+        # Pool bigger than the per-call cap, so only _parallel_map's window limits it
+        app = Flask(__name__)
+        app.config["LINEUPS_MAX_WORKERS"] = 8
+        self.ctx = app.app_context()
+        self.ctx.push()
+        lineups._EXECUTOR = None
+
+    def tearDown(self):
+        if lineups._EXECUTOR is not None:
+            lineups._EXECUTOR.shutdown(wait=True)
+            lineups._EXECUTOR = None
+        self.ctx.pop()
+
+    def test_never_exceeds_max_workers_in_flight(self):
+        for cap in (2, 3):
+            func = _InFlight()
+            out = lineups._parallel_map(func, list(range(20)), max_workers=cap)
+            self.assertEqual(out, [x * 2 for x in range(20)])
+            self.assertLessEqual(func.peak, cap)
+            self.assertGreater(func.peak, 1)
+
+    def test_default_cap_comes_from_config(self):
+        func = _InFlight()
+        lineups._parallel_map(func, list(range(30)))
+        self.assertLessEqual(func.peak, 8)
+
+    def test_iter_completed_never_exceeds_max_workers_in_flight(self):
+        func = _InFlight()
+        got = dict(lineups._iter_completed(func, list(range(20)), max_workers=2))
+        self.assertEqual(got, {x: x * 2 for x in range(20)})
+        self.assertLessEqual(func.peak, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
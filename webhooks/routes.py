@@ -16,6 +16,7 @@ import os
 from datetime import datetime, timezone, timedelta
 from typing import Any, Dict, Optional
 
+import stripe
 from flask import Blueprint, current_app, request, jsonify
 
 from app import db
@@ -26,12 +27,18 @@ bp = Blueprint("stripe_webhooks", __name__, url_prefix="/webhooks/stripe")
 
 # ------------------ config helpers ------------------
 
+@bp.record_once
+def _init_stripe(state) -> None:
+    """Set the Stripe API key once, when the blueprint is registered."""
+    key = (os.getenv("STRIPE_SECRET_KEY", "") or state.app.config.get("STRIPE_SECRET_KEY") or "").strip()
+    if key:
+        stripe.api_key = key
+    else:
+        state.app.logger.warning("STRIPE_SECRET_KEY not set; Stripe webhooks will fail")
+
 def _stripe():
-    import stripe
-    key = os.getenv("STRIPE_SECRET_KEY", "").strip()
-    if not key:
+    if not stripe.api_key:
         raise RuntimeError("STRIPE_SECRET_KEY not set")
-    stripe.api_key = key
     return stripe
 
 def _endpoint_secret() -> str: